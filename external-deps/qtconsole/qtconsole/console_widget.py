@@ -6,7 +6,6 @@
 from functools import partial
 import os
 import os.path
-import re
 import sys
 from textwrap import dedent
 import time
@@ -219,6 +218,14 @@ class ConsoleWidget(MetaQObjectHasTraits('NewBase', (LoggingConfigurable, superQ
 
     _temp_buffer_filled = False
 
+    # Characters that make the ANSI processor do more than inserting text,
+    # besides newlines.
+    _ansi_special_chars = '\x1b\a\b\r\f'
+
+    # Splitter orientation of the paging styles that use one.
+    _paging_orientation = { 'hsplit' : QtCore.Qt.Horizontal,
+                            'vsplit' : QtCore.Qt.Vertical }
+
     #---------------------------------------------------------------------------
     # 'QObject' interface
     #---------------------------------------------------------------------------
@@ -246,16 +253,27 @@ class ConsoleWidget(MetaQObjectHasTraits('NewBase', (LoggingConfigurable, superQ
         if hasattr(QtCore.QEvent, 'NativeGesture'):
             self._pager_scroll_events.append(QtCore.QEvent.NativeGesture)
 
+        # Timer to coalesce the scrollbar adjustments requested while the
+        # document size changes. It must exist before the control is created,
+        # since the control's document layout is connected to it.
+        self._adjust_scrollbars_timer = QtCore.QTimer(self)
+        self._adjust_scrollbars_timer.setInterval(0)
+        self._adjust_scrollbars_timer.setSingleShot(True)
+        self._adjust_scrollbars_timer.timeout.connect(
+                                            self._adjust_scrollbars_now)
+
+        # The context menu is created the first time it's requested.
+        self._context_menu = None
+        self._context_menu_anchor = ''
+
         # Create the layout and underlying text widget.
         layout = QtWidgets.QStackedLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         self._control = self._create_control()
-        if self.paging in ('hsplit', 'vsplit'):
+        if self.paging in self._paging_orientation:
             self._splitter = QtWidgets.QSplitter()
-            if self.paging == 'hsplit':
-                self._splitter.setOrientation(QtCore.Qt.Horizontal)
-            else:
-                self._splitter.setOrientation(QtCore.Qt.Vertical)
+            self._splitter.setOrientation(
+                self._paging_orientation[self.paging])
             self._splitter.addWidget(self._control)
             layout.addWidget(self._splitter)
         else:
@@ -274,6 +292,15 @@ class ConsoleWidget(MetaQObjectHasTraits('NewBase', (LoggingConfigurable, superQ
         # information for subclasses; they should be considered read-only.
         self._append_before_prompt_cursor = self._control.textCursor()
         self._ansi_processor = QtAnsiCodeProcessor()
+        self._ansi_action_handlers = {
+            'erase': self._ansi_erase,
+            'scroll': self._ansi_scroll,
+            'move': self._ansi_move,
+            'carriage-return': self._ansi_carriage_return,
+            'beep': self._ansi_beep,
+            'backspace': self._ansi_backspace,
+            'newline': self._ansi_newline,
+        }
         if self.gui_completion == 'ncurses':
             self._completion_widget = CompletionHtml(self, self.gui_completion_height)
         elif self.gui_completion == 'droplist':
@@ -460,7 +487,7 @@ class ConsoleWidget(MetaQObjectHasTraits('NewBase', (LoggingConfigurable, superQ
         elif etype == QtCore.QEvent.Resize and not self._filter_resize:
             self._filter_resize = True
             QtWidgets.QApplication.instance().sendEvent(obj, event)
-            self._adjust_scrollbars()
+            self._adjust_scrollbars_now()
             self._filter_resize = False
             return True
 
@@ -717,10 +744,10 @@ class ConsoleWidget(MetaQObjectHasTraits('NewBase', (LoggingConfigurable, superQ
 
         # There is no prompt now, so before_prompt_position is eof
         self._append_before_prompt_cursor.setPosition(
-            self._get_end_cursor().position())
+            self._get_end_pos())
 
         self._insert_text_cursor.setPosition(
-            self._get_end_cursor().position())
+            self._get_end_pos())
 
         # The maximum block count is only in effect during execution.
         # This ensures that _prompt_pos does not become invalid due to
@@ -795,6 +822,9 @@ class ConsoleWidget(MetaQObjectHasTraits('NewBase', (LoggingConfigurable, superQ
             self.tab_width * self._get_font_width(font)
         )
 
+        # Cache the line height, which is needed each time text is paged.
+        self._line_height = QtGui.QFontMetrics(font).height()
+
         self._completion_widget.setFont(font)
         self._control.document().setDefaultFont(font)
         if self._page_control:
@@ -1141,38 +1171,55 @@ class ConsoleWidget(MetaQObjectHasTraits('NewBase', (LoggingConfigurable, superQ
 
     def _context_menu_make(self, pos):
         """ Creates a context menu for the given QPoint (in widget coordinates).
+
+        The menu is built the first time it's requested and reused afterwards,
+        refreshing only the actions that depend on the current state.
         """
-        menu = QtWidgets.QMenu(self)
+        menu = self._context_menu
+        if menu is None:
+            menu = self._context_menu = QtWidgets.QMenu(self)
 
-        self.cut_action = menu.addAction('Cut', self.cut)
-        self.cut_action.setEnabled(self.can_cut())
-        self.cut_action.setShortcut(QtGui.QKeySequence.Cut)
+            self.cut_action = menu.addAction('Cut', self.cut)
+            self.cut_action.setShortcut(QtGui.QKeySequence.Cut)
 
-        self.copy_action = menu.addAction('Copy', self.copy)
-        self.copy_action.setEnabled(self.can_copy())
-        self.copy_action.setShortcut(QtGui.QKeySequence.Copy)
+            self.copy_action = menu.addAction('Copy', self.copy)
+            self.copy_action.setShortcut(QtGui.QKeySequence.Copy)
 
-        self.paste_action = menu.addAction('Paste', self.paste)
-        self.paste_action.setEnabled(self.can_paste())
-        self.paste_action.setShortcut(QtGui.QKeySequence.Paste)
+            self.paste_action = menu.addAction('Paste', self.paste)
+            self.paste_action.setShortcut(QtGui.QKeySequence.Paste)
 
-        anchor = self._control.anchorAt(pos)
-        if anchor:
-            menu.addSeparator()
+            self._link_separator = menu.addSeparator()
             self.copy_link_action = menu.addAction(
-                'Copy Link Address', lambda: self.copy_anchor(anchor=anchor))
+                'Copy Link Address',
+                lambda: self.copy_anchor(anchor=self._context_menu_anchor))
             self.open_link_action = menu.addAction(
-                'Open Link', lambda: self.open_anchor(anchor=anchor))
+                'Open Link',
+                lambda: self.open_anchor(anchor=self._context_menu_anchor))
 
-        menu.addSeparator()
-        menu.addAction(self.select_all_action)
+            menu.addSeparator()
+            menu.addAction(self.select_all_action)
 
-        menu.addSeparator()
-        menu.addAction(self.export_action)
-        menu.addAction(self.print_action)
+            menu.addSeparator()
+            menu.addAction(self.export_action)
+            menu.addAction(self.print_action)
 
+        self._refresh_context_menu_actions(pos)
         return menu
 
+    def _refresh_context_menu_actions(self, pos):
+        """ Updates the context menu actions for the given QPoint (in widget
+            coordinates).
+        """
+        self.cut_action.setEnabled(self.can_cut())
+        self.copy_action.setEnabled(self.can_copy())
+        self.paste_action.setEnabled(self.can_paste())
+
+        anchor = self._control.anchorAt(pos)
+        self._context_menu_anchor = anchor
+        for action in (self._link_separator, self.copy_link_action,
+                       self.open_link_action):
+            action.setVisible(bool(anchor))
+
     def _control_key_down(self, modifiers, include_command=False):
         """ Given a KeyboardModifiers flags object, return whether the Control
         key is down.
@@ -1316,8 +1363,8 @@ class ConsoleWidget(MetaQObjectHasTraits('NewBase', (LoggingConfigurable, superQ
                     cursor.movePosition(QtGui.QTextCursor.End,
                                         QtGui.QTextCursor.KeepAnchor)
                     at_end = len(cursor.selectedText().strip()) == 0
-                    single_line = (self._get_end_cursor().blockNumber() ==
-                                   self._get_prompt_cursor().blockNumber())
+                    single_line = (self._end_block_number ==
+                                   self._prompt_block_number)
                     if (at_end or shift_down or single_line) and not ctrl_down:
                         self.execute(interactive = not shift_down)
                     else:
@@ -1378,7 +1425,7 @@ class ConsoleWidget(MetaQObjectHasTraits('NewBase', (LoggingConfigurable, superQ
                 if self._in_buffer(position):
                     cursor.clearSelection()
                     start_line = cursor.blockNumber()
-                    if start_line == self._get_prompt_cursor().blockNumber():
+                    if start_line == self._prompt_block_number:
                         offset = len(self._prompt)
                     else:
                         offset = len(self._continuation_prompt)
@@ -1483,14 +1530,14 @@ class ConsoleWidget(MetaQObjectHasTraits('NewBase', (LoggingConfigurable, superQ
                 if self._reading or not self._up_pressed(shift_down):
                     intercepted = True
                 else:
-                    prompt_line = self._get_prompt_cursor().blockNumber()
+                    prompt_line = self._prompt_block_number
                     intercepted = cursor.blockNumber() <= prompt_line
 
             elif key == QtCore.Qt.Key_Down and not shift_down:
                 if self._reading or not self._down_pressed(shift_down):
                     intercepted = True
                 else:
-                    end_line = self._get_end_cursor().blockNumber()
+                    end_line = self._end_block_number
                     intercepted = cursor.blockNumber() == end_line
 
             elif key == QtCore.Qt.Key_Tab:
@@ -1507,7 +1554,7 @@ class ConsoleWidget(MetaQObjectHasTraits('NewBase', (LoggingConfigurable, superQ
 
                 # Move to the previous line
                 line, col = cursor.blockNumber(), cursor.columnNumber()
-                if line > self._get_prompt_cursor().blockNumber() and \
+                if line > self._prompt_block_number and \
                         col == len(self._continuation_prompt):
                     self._control.moveCursor(QtGui.QTextCursor.PreviousBlock,
                                              mode=anchormode)
@@ -1558,7 +1605,7 @@ class ConsoleWidget(MetaQObjectHasTraits('NewBase', (LoggingConfigurable, superQ
                 line, col = cursor.blockNumber(), cursor.columnNumber()
                 if not self._reading and \
                         col == len(self._continuation_prompt) and \
-                        line > self._get_prompt_cursor().blockNumber():
+                        line > self._prompt_block_number:
                     cursor.beginEditBlock()
                     cursor.movePosition(QtGui.QTextCursor.StartOfBlock,
                                         QtGui.QTextCursor.KeepAnchor)
@@ -1729,14 +1776,15 @@ class ConsoleWidget(MetaQObjectHasTraits('NewBase', (LoggingConfigurable, superQ
     def _get_end_pos(self):
         """ Get the position of the last character of the current cell.
         """
-        return self._get_end_cursor().position()
+        # Same as self._get_end_cursor().position(), without creating a cursor
+        return self._control.document().characterCount() - 1
 
     def _get_line_start_cursor(self):
         """ Get a cursor at the first character of the current line.
         """
         cursor = self._control.textCursor()
         start_line = cursor.blockNumber()
-        if start_line == self._get_prompt_cursor().blockNumber():
+        if start_line == self._prompt_block_number:
             cursor.setPosition(self._prompt_pos)
         else:
             cursor.movePosition(QtGui.QTextCursor.StartOfLine)
@@ -1801,7 +1849,7 @@ class ConsoleWidget(MetaQObjectHasTraits('NewBase', (LoggingConfigurable, superQ
             return None
         cursor = self._control.textCursor()
         if cursor.position() >= self._prompt_pos:
-            if cursor.blockNumber() == self._get_prompt_cursor().blockNumber():
+            if cursor.blockNumber() == self._prompt_block_number:
                 return self._prompt
             else:
                 return self._continuation_prompt
@@ -1851,7 +1899,7 @@ class ConsoleWidget(MetaQObjectHasTraits('NewBase', (LoggingConfigurable, superQ
 
         cursor = self._get_cursor()
         start_line = cursor.blockNumber()
-        if start_line == self._get_prompt_cursor().blockNumber():
+        if start_line == self._prompt_block_number:
             # first line
             offset = len(self._prompt)
         else:
@@ -1874,6 +1922,19 @@ class ConsoleWidget(MetaQObjectHasTraits('NewBase', (LoggingConfigurable, superQ
         return min(self._append_before_prompt_cursor.position(),
                    self._get_end_pos())
 
+    @property
+    def _end_block_number(self):
+        """ Find the block number of the last line of the current cell.
+        """
+        return self._control.document().blockCount() - 1
+
+    @property
+    def _prompt_block_number(self):
+        """ Find the block number of the line holding the prompt.
+        """
+        return self._control.document().findBlock(
+            self._prompt_pos).blockNumber()
+
     def _get_prompt_cursor(self):
         """ Get a cursor at the prompt position of the current cell.
         """
@@ -2110,11 +2171,179 @@ class ConsoleWidget(MetaQObjectHasTraits('NewBase', (LoggingConfigurable, superQ
 
     def _scroll_to_end(self):
         """Scroll to the end of the document."""
-        end_scroll = (self._control.verticalScrollBar().maximum()
-                      - self._control.verticalScrollBar().pageStep())
+        self._flush_adjust_scrollbars()
+        scrollbar = self._control.verticalScrollBar()
+        end_scroll = scrollbar.maximum() - scrollbar.pageStep()
         # Only scroll down
-        if end_scroll > self._control.verticalScrollBar().value():
-            self._control.verticalScrollBar().setValue(end_scroll)
+        if end_scroll > scrollbar.value():
+            scrollbar.setValue(end_scroll)
+
+    def _ansi_erase(self, cursor, act):
+        """ Handle an ANSI erase action.
+
+        Unlike real terminal emulators, we don't distinguish between the
+        screen and the scrollback buffer. A screen erase request clears
+        everything.
+        """
+        remove = False
+        fill = False
+        if act.area == 'screen':
+            cursor.select(QtGui.QTextCursor.Document)
+            remove = True
+        if act.area == 'line':
+            if act.erase_to == 'all':
+                cursor.select(QtGui.QTextCursor.LineUnderCursor)
+                remove = True
+            elif act.erase_to == 'start':
+                cursor.movePosition(
+                    QtGui.QTextCursor.StartOfLine,
+                    QtGui.QTextCursor.KeepAnchor)
+                remove = True
+                fill = True
+            elif act.erase_to == 'end':
+                cursor.movePosition(
+                    QtGui.QTextCursor.EndOfLine,
+                    QtGui.QTextCursor.KeepAnchor)
+                remove = True
+        if remove:
+            nspace=cursor.selectionEnd()-cursor.selectionStart() if fill else 0
+            cursor.removeSelectedText()
+            if nspace>0: cursor.insertText(' '*nspace) # replace text by space, to keep cursor position as specified
+
+    def _ansi_scroll(self, cursor, act):
+        """ Handle an ANSI scroll action.
+
+        Simulate a form feed by scrolling just past the last line.
+        """
+        if act.unit == 'page':
+            cursor.insertText('\n')
+            cursor.endEditBlock()
+            self._set_top_cursor(cursor)
+            cursor.joinPreviousEditBlock()
+            cursor.deletePreviousChar()
+
+            if os.name == 'nt':
+                cursor.select(QtGui.QTextCursor.Document)
+                cursor.removeSelectedText()
+
+    def _ansi_move(self, cursor, act):
+        """ Handle an ANSI cursor move action.
+        """
+        if act.unit == 'line':
+            if act.dir == 'up':
+                cursor.movePosition(
+                    QtGui.QTextCursor.Up,
+                    QtGui.QTextCursor.MoveAnchor,
+                    act.count
+                )
+            elif act.dir == 'down':
+                cursor.movePosition(
+                    QtGui.QTextCursor.Down,
+                    QtGui.QTextCursor.MoveAnchor,
+                    act.count
+                )
+            elif act.dir == 'leftup':
+                cursor.movePosition(
+                    QtGui.QTextCursor.Up,
+                    QtGui.QTextCursor.MoveAnchor,
+                    act.count
+                )
+                cursor.movePosition(
+                    QtGui.QTextCursor.StartOfLine,
+                    QtGui.QTextCursor.MoveAnchor
+                )
+
+    def _ansi_carriage_return(self, cursor, act):
+        """ Handle an ANSI carriage return action.
+        """
+        cursor.movePosition(
+            QtGui.QTextCursor.StartOfLine,
+            QtGui.QTextCursor.MoveAnchor)
+
+    def _ansi_beep(self, cursor, act):
+        """ Handle an ANSI beep action.
+        """
+        QtWidgets.QApplication.instance().beep()
+
+    def _ansi_backspace(self, cursor, act):
+        """ Handle an ANSI backspace action.
+        """
+        if not cursor.atBlockStart():
+            cursor.movePosition(
+                QtGui.QTextCursor.PreviousCharacter,
+                QtGui.QTextCursor.MoveAnchor)
+
+    def _ansi_newline(self, cursor, act):
+        """ Handle an ANSI newline action.
+        """
+        document = cursor.document()
+        if (
+            cursor.block() != document.lastBlock()
+            and not self._document_ends_with_prompt(document)
+        ):
+            cursor.movePosition(QtGui.QTextCursor.NextBlock)
+        else:
+            cursor.movePosition(
+                QtGui.QTextCursor.EndOfLine,
+                QtGui.QTextCursor.MoveAnchor,
+            )
+            # Same as inserting "\n", without going through text insertion
+            cursor.insertBlock()
+
+    def _split_ansi_string(self, text):
+        """ Yields the substrings of text given by the ANSI processor together
+            with their actions.
+
+        Runs of cursor moves in the same direction (e.g. several "cursor up"
+        sequences in a row) are merged into a single move, so that the cursor
+        is moved once instead of once per sequence.
+        """
+        pending_move = None
+        for substring in self._ansi_processor.split_string(text):
+            actions = self._ansi_processor.actions
+            if (substring == '' and len(actions) == 1 and
+                    actions[0].action == 'move'):
+                act = actions[0]
+                if (pending_move is not None and
+                        pending_move.dir == act.dir and
+                        pending_move.unit == act.unit):
+                    pending_move = pending_move._replace(
+                        count=pending_move.count + act.count)
+                    continue
+                if pending_move is not None:
+                    yield '', [pending_move]
+                pending_move = act
+                continue
+
+            if pending_move is not None:
+                yield '', [pending_move]
+                pending_move = None
+            yield substring, actions
+
+        if pending_move is not None:
+            yield '', [pending_move]
+
+    def _document_ends_with_prompt(self, document):
+        """ Check whether the text of the document ends with the prompt.
+        """
+        if '\n' in self._prompt:
+            return document.toPlainText().endswith(self._prompt)
+        # A single line prompt can only be in the last block, so there is no
+        # need to copy the text of the whole document.
+        return document.lastBlock().text().endswith(self._prompt)
+
+    def _is_plain_stream_text(self, cursor, text):
+        """ Check whether text can be inserted as is, without going through
+            the ANSI processor.
+
+        This is the case when it has no ANSI escape sequences nor special
+        characters other than newlines, and it's inserted at the end of the
+        document, where newlines always start a new line and there's nothing
+        to overwrite.
+        """
+        if not cursor.atEnd():
+            return False
+        return not any(char in text for char in self._ansi_special_chars)
 
     def _insert_plain_text(self, cursor, text, flush=False):
         """ Inserts plain text using the specified cursor, processing ANSI codes
@@ -2143,100 +2372,17 @@ class ConsoleWidget(MetaQObjectHasTraits('NewBase', (LoggingConfigurable, superQ
             text = self._get_last_lines(text, buffer_size)
 
         cursor.beginEditBlock()
-        if self.ansi_codes:
-            for substring in self._ansi_processor.split_string(text):
-                for act in self._ansi_processor.actions:
-
-                    # Unlike real terminal emulators, we don't distinguish
-                    # between the screen and the scrollback buffer. A screen
-                    # erase request clears everything.
-                    if act.action == 'erase':
-                        remove = False
-                        fill = False
-                        if act.area == 'screen':
-                            cursor.select(QtGui.QTextCursor.Document)
-                            remove = True
-                        if act.area == 'line':
-                            if act.erase_to == 'all':
-                                cursor.select(QtGui.QTextCursor.LineUnderCursor)
-                                remove = True
-                            elif act.erase_to == 'start':
-                                cursor.movePosition(
-                                    QtGui.QTextCursor.StartOfLine,
-                                    QtGui.QTextCursor.KeepAnchor)
-                                remove = True
-                                fill = True
-                            elif act.erase_to == 'end':
-                                cursor.movePosition(
-                                    QtGui.QTextCursor.EndOfLine,
-                                    QtGui.QTextCursor.KeepAnchor)
-                                remove = True
-                        if remove:
-                            nspace=cursor.selectionEnd()-cursor.selectionStart() if fill else 0
-                            cursor.removeSelectedText()
-                            if nspace>0: cursor.insertText(' '*nspace) # replace text by space, to keep cursor position as specified
-
-                    # Simulate a form feed by scrolling just past the last line.
-                    elif act.action == 'scroll' and act.unit == 'page':
-                        cursor.insertText('\n')
-                        cursor.endEditBlock()
-                        self._set_top_cursor(cursor)
-                        cursor.joinPreviousEditBlock()
-                        cursor.deletePreviousChar()
-
-                        if os.name == 'nt':
-                            cursor.select(QtGui.QTextCursor.Document)
-                            cursor.removeSelectedText()
-
-                    elif act.action == 'move' and act.unit == 'line':
-                        if act.dir == 'up':
-                            for i in range(act.count):
-                                cursor.movePosition(
-                                    QtGui.QTextCursor.Up
-                                )
-                        elif act.dir == 'down':
-                            for i in range(act.count):
-                                cursor.movePosition(
-                                    QtGui.QTextCursor.Down
-                                )
-                        elif act.dir == 'leftup':
-                            for i in range(act.count):
-                                cursor.movePosition(
-                                    QtGui.QTextCursor.Up
-                                )
-                            cursor.movePosition(
-                                QtGui.QTextCursor.StartOfLine,
-                                QtGui.QTextCursor.MoveAnchor
-                            )
-
-                    elif act.action == 'carriage-return':
-                        cursor.movePosition(
-                            QtGui.QTextCursor.StartOfLine,
-                            QtGui.QTextCursor.MoveAnchor)
-
-                    elif act.action == 'beep':
-                        QtWidgets.QApplication.instance().beep()
-
-                    elif act.action == 'backspace':
-                        if not cursor.atBlockStart():
-                            cursor.movePosition(
-                                QtGui.QTextCursor.PreviousCharacter,
-                                QtGui.QTextCursor.MoveAnchor)
-
-                    elif act.action == 'newline':
-                        if (
-                            cursor.block() != cursor.document().lastBlock()
-                            and not cursor.document()
-                            .toPlainText()
-                            .endswith(self._prompt)
-                        ):
-                            cursor.movePosition(QtGui.QTextCursor.NextBlock)
-                        else:
-                            cursor.movePosition(
-                                QtGui.QTextCursor.EndOfLine,
-                                QtGui.QTextCursor.MoveAnchor,
-                            )
-                            cursor.insertText("\n")
+        if self.ansi_codes and self._is_plain_stream_text(cursor, text):
+            # Fast path for text without escape sequences or special
+            # characters written at the end of the document, for which the
+            # ANSI processor would only yield the text itself.
+            cursor.insertText(text, self._ansi_processor.get_format())
+        elif self.ansi_codes:
+            for substring, actions in self._split_ansi_string(text):
+                for act in actions:
+                    handler = self._ansi_action_handlers.get(act.action)
+                    if handler is not None:
+                        handler(cursor, act)
 
                 # simulate replacement mode
                 if substring is not None:
@@ -2245,11 +2391,14 @@ class ConsoleWidget(MetaQObjectHasTraits('NewBase', (LoggingConfigurable, superQ
                     # Note that using _insert_mode means the \r ANSI sequence will not swallow characters.
                     if not (hasattr(cursor, '_insert_mode') and cursor._insert_mode):
                         pos = cursor.position()
-                        cursor2 = QtGui.QTextCursor(cursor)  # self._get_line_end_pos() is the previous line, don't use it
-                        cursor2.movePosition(QtGui.QTextCursor.EndOfLine)
-                        remain = cursor2.position() - pos    # number of characters until end of line
+                        # Measure with the cursor itself instead of a copy of
+                        # it, then move it back (self._get_line_end_pos() is
+                        # the previous line, don't use it)
+                        cursor.movePosition(QtGui.QTextCursor.EndOfLine)
+                        remain = cursor.position() - pos     # number of characters until end of line
                         n=len(substring)
                         swallow = min(n, remain)             # number of character to swallow
+                        cursor.setPosition(pos)
                         cursor.setPosition(pos + swallow, QtGui.QTextCursor.KeepAnchor)
                     cursor.insertText(substring, format)
         else:
@@ -2271,15 +2420,17 @@ class ConsoleWidget(MetaQObjectHasTraits('NewBase', (LoggingConfigurable, superQ
                 # continuation prompt is produced.
                 lines.append('')
             cursor.beginEditBlock()
-            cursor.insertText(lines[0])
-            for line in lines[1:]:
-                if self._continuation_prompt_html is None:
-                    cursor.insertText(self._continuation_prompt)
-                else:
+            if self._continuation_prompt_html is None:
+                # Plain text prompts can be inserted with the lines in a
+                # single call.
+                cursor.insertText(self._continuation_prompt.join(lines))
+            else:
+                cursor.insertText(lines[0])
+                for line in lines[1:]:
                     self._continuation_prompt = \
                         self._insert_html_fetching_plain_text(
                             cursor, self._continuation_prompt_html)
-                cursor.insertText(line)
+                    cursor.insertText(line)
             cursor.endEditBlock()
 
     def _in_buffer(self, position):
@@ -2288,40 +2439,49 @@ class ConsoleWidget(MetaQObjectHasTraits('NewBase', (LoggingConfigurable, superQ
         """
         return position == self._move_position_in_buffer(position)
 
-    def _move_position_in_buffer(self, position):
+    def _move_position_in_buffer(self, position, prompt_pos=None,
+                                 prompt_line=None):
         """
         Return the next position in buffer.
+
+        The prompt position and the line it's in can be passed by callers
+        that already computed them.
         """
-        cursor = self._control.textCursor()
-        cursor.setPosition(position)
-        line = cursor.blockNumber()
-        prompt_line = self._get_prompt_cursor().blockNumber()
+        # Look blocks up directly in the document rather than creating
+        # temporary cursors, since this runs several times per keystroke.
+        document = self._control.document()
+        block = document.findBlock(position)
+        line = block.blockNumber()
+        if prompt_pos is None:
+            prompt_pos = self._prompt_pos
+        if prompt_line is None:
+            prompt_line = document.findBlock(prompt_pos).blockNumber()
         if line == prompt_line:
-            if position >= self._prompt_pos:
+            if position >= prompt_pos:
                 return position
-            return self._prompt_pos
+            return prompt_pos
         if line > prompt_line:
-            cursor.movePosition(QtGui.QTextCursor.StartOfBlock)
-            prompt_pos = cursor.position() + len(self._continuation_prompt)
+            prompt_pos = block.position() + len(self._continuation_prompt)
             if position >= prompt_pos:
                 return position
             return prompt_pos
-        return self._prompt_pos
+        return prompt_pos
 
     def _keep_cursor_in_buffer(self):
         """ Ensures that the cursor is inside the editing region. Returns
             whether the cursor was moved.
         """
         cursor = self._control.textCursor()
+        document = self._control.document()
         endpos = cursor.selectionEnd()
+        prompt_pos = self._prompt_pos
+        prompt_line = document.findBlock(prompt_pos).blockNumber()
 
-        if endpos < self._prompt_pos:
-            cursor.setPosition(endpos)
-            line = cursor.blockNumber()
-            prompt_line = self._get_prompt_cursor().blockNumber()
+        if endpos < prompt_pos:
+            line = document.findBlock(endpos).blockNumber()
             if line == prompt_line:
                 # Cursor is on prompt line, move to start of buffer
-                cursor.setPosition(self._prompt_pos)
+                cursor.setPosition(prompt_pos)
             else:
                 # Cursor is not in buffer, move to the end
                 cursor.movePosition(QtGui.QTextCursor.End)
@@ -2330,8 +2490,16 @@ class ConsoleWidget(MetaQObjectHasTraits('NewBase', (LoggingConfigurable, superQ
 
         startpos = cursor.selectionStart()
 
-        new_endpos = self._move_position_in_buffer(endpos)
-        new_startpos = self._move_position_in_buffer(startpos)
+        # The selection is on the prompt line and after the prompt, which is
+        # the usual case while typing, so it's already inside the buffer.
+        if (startpos >= prompt_pos and
+                document.findBlock(endpos).blockNumber() == prompt_line):
+            return False
+
+        new_endpos = self._move_position_in_buffer(
+            endpos, prompt_pos, prompt_line)
+        new_startpos = self._move_position_in_buffer(
+            startpos, prompt_pos, prompt_line)
         if new_endpos == endpos and new_startpos == startpos:
             return False
 
@@ -2358,10 +2526,16 @@ class ConsoleWidget(MetaQObjectHasTraits('NewBase', (LoggingConfigurable, superQ
         html : bool, optional (default False)
             If set, the text will be interpreted as HTML instead of plain text.
         """
-        line_height = QtGui.QFontMetrics(self.font).height()
-        minlines = self._control.viewport().height() / line_height
-        if self.paging != 'none' and \
-                re.match("(?:[^\n]*\n){%i}" % minlines, text):
+        if self.paging == 'none':
+            # Nothing to measure when paging is disabled
+            if html:
+                self._append_html(text)
+            else:
+                self._append_plain_text(text)
+            return
+
+        minlines = self._control.viewport().height() / self._line_height
+        if text.count('\n') >= int(minlines):
             if self.paging == 'custom':
                 self.custom_page_requested.emit(text)
             else:
@@ -2398,10 +2572,9 @@ class ConsoleWidget(MetaQObjectHasTraits('NewBase', (LoggingConfigurable, superQ
         if self._splitter is None:
             raise NotImplementedError("""can only switch if --paging=hsplit or
                     --paging=vsplit is used.""")
-        if paging == 'hsplit':
-            self._splitter.setOrientation(QtCore.Qt.Horizontal)
-        elif paging == 'vsplit':
-            self._splitter.setOrientation(QtCore.Qt.Vertical)
+        orientation = self._paging_orientation.get(paging)
+        if orientation is not None:
+            self._splitter.setOrientation(orientation)
         elif paging == 'inside':
             raise NotImplementedError("""switching to 'inside' paging not
                     supported yet.""")
@@ -2419,15 +2592,22 @@ class ConsoleWidget(MetaQObjectHasTraits('NewBase', (LoggingConfigurable, superQ
     def _prompt_started(self):
         """ Called immediately after a new prompt is displayed.
         """
-        # Temporarily disable the maximum block count to permit undo/redo and
-        # to ensure that the prompt position does not change due to truncation.
-        self._control.document().setMaximumBlockCount(0)
-        self._control.setUndoRedoEnabled(True)
+        # Switch the control to editing mode with updates disabled, so that
+        # the changes below result in a single repaint.
+        self._control.setUpdatesEnabled(False)
+        try:
+            # Temporarily disable the maximum block count to permit undo/redo
+            # and to ensure that the prompt position does not change due to
+            # truncation.
+            self._control.document().setMaximumBlockCount(0)
+            self._control.setUndoRedoEnabled(True)
 
-        # Work around bug in QPlainTextEdit: input method is not re-enabled
-        # when read-only is disabled.
-        self._control.setReadOnly(False)
-        self._control.setAttribute(QtCore.Qt.WA_InputMethodEnabled, True)
+            # Work around bug in QPlainTextEdit: input method is not
+            # re-enabled when read-only is disabled.
+            self._control.setReadOnly(False)
+            self._control.setAttribute(QtCore.Qt.WA_InputMethodEnabled, True)
+        finally:
+            self._control.setUpdatesEnabled(True)
 
         if not self._reading:
             self._executing = False
@@ -2513,6 +2693,7 @@ class ConsoleWidget(MetaQObjectHasTraits('NewBase', (LoggingConfigurable, superQ
     def _set_top_cursor(self, cursor):
         """ Scrolls the viewport so that the specified cursor is at the top.
         """
+        self._flush_adjust_scrollbars()
         scrollbar = self._control.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
         original_cursor = self._control.textCursor()
@@ -2546,14 +2727,18 @@ class ConsoleWidget(MetaQObjectHasTraits('NewBase', (LoggingConfigurable, superQ
         # This is necessary to solve out-of-order insertion of mixed stdin and
         # stdout stream texts.
         # Fixes griffin-ide/griffin#17710
+        # Only the pending stream messages matter here, so user input is left
+        # in the queue instead of re-entering the key and mouse handlers while
+        # the prompt is being written.
+        flags = QtCore.QEventLoop.ExcludeUserInputEvents
         if sys.platform == 'darwin':
             # Although this makes our tests hang on Mac, users confirmed that
             # it's needed on that platform too.
             # Fixes griffin-ide/griffin#19888
             if not os.environ.get('QTCONSOLE_TESTING'):
-                QtCore.QCoreApplication.processEvents()
+                QtCore.QCoreApplication.processEvents(flags)
         else:
-            QtCore.QCoreApplication.processEvents()
+            QtCore.QCoreApplication.processEvents(flags)
 
         cursor = self._get_end_cursor()
 
@@ -2608,6 +2793,22 @@ class ConsoleWidget(MetaQObjectHasTraits('NewBase', (LoggingConfigurable, superQ
     #------ Signal handlers ----------------------------------------------------
 
     def _adjust_scrollbars(self):
+        """ Schedules an adjustment of the vertical scrollbar.
+
+        The document size changes many times while text is streamed in, so
+        the adjustment is done once when control returns to the event loop.
+        """
+        if not self._adjust_scrollbars_timer.isActive():
+            self._adjust_scrollbars_timer.start()
+
+    def _flush_adjust_scrollbars(self):
+        """ Performs a pending scrollbar adjustment right away.
+        """
+        if self._adjust_scrollbars_timer.isActive():
+            self._adjust_scrollbars_timer.stop()
+            self._adjust_scrollbars_now()
+
+    def _adjust_scrollbars_now(self):
         """ Expands the vertical scrollbar beyond the range set by Qt.
         """
         # This code is adapted from _q_adjustScrollbars in qplaintextedit.cpp
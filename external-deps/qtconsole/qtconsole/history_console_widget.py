@@ -118,8 +118,7 @@ class HistoryConsoleWidget(ConsoleWidget):
         """ Called when the down key is pressed. Returns whether to continue
             processing the event.
         """
-        end_cursor = self._get_end_cursor()
-        if self._get_cursor().blockNumber() == end_cursor.blockNumber():
+        if self._get_cursor().blockNumber() == self._end_block_number:
             # Bail out if we're locked.
             if self._history_locked() and not shift_modifier:
                 return False
@@ -232,8 +231,7 @@ class HistoryConsoleWidget(ConsoleWidget):
         return (self.history_lock and
                 (self._get_edited_history(self._history_index) !=
                  self.input_buffer) and
-                (self._get_prompt_cursor().blockNumber() !=
-                 self._get_end_cursor().blockNumber()))
+                (self._prompt_block_number != self._end_block_number))
 
     def _get_edited_history(self, index):
         """ Retrieves a history item, possibly with temporary edits.
@@ -371,6 +371,41 @@ class TestConsoleWidget(unittest.TestCase):
             # clear all the text
             cursor.insertText('')
 
+    def test_move_cursor_runs(self):
+        """ Do runs of cursor movement sequences move the cursor as a whole?
+        """
+        w = ConsoleWidget()
+        cursor = w._get_prompt_cursor()
+
+        w._insert_plain_text(cursor, 'a\nb\nc\nd\n')
+        w._insert_plain_text(cursor,
+                             '\x1b[1A\x1b[1A\x1b[2AX\x1b[1BY\x1b[1B\x1b[1BZ')
+        self.assert_text_equal(cursor, 'X\u2029Y\u2029c\u2029Z\u2029')
+
+        actions = [
+            actions for substring, actions in
+            w._split_ansi_string('\x1b[1A\x1b[2A\x1b[1B')
+        ]
+        self.assertEqual(
+            [(act.dir, act.count) for acts in actions for act in acts],
+            [('up', 3), ('down', 1)])
+
+    def test_context_menu_reused(self):
+        """ Is the context menu built once and refreshed on each request?
+        """
+        w = ConsoleWidget()
+        pos = QtCore.QPoint(0, 0)
+
+        menu = w._context_menu_make(pos)
+        self.assertIs(w._context_menu_make(pos), menu)
+        self.assertFalse(w.open_link_action.isVisible())
+        self.assertFalse(w.copy_action.isEnabled())
+
+        w._append_plain_text('Hello')
+        w.select_all_smart()
+        w._context_menu_make(pos)
+        self.assertTrue(w.copy_action.isEnabled())
+
     def test_print_carriage_return(self):
         """ Test that overwriting the current line works as intended,
             before and after the cursor prompt.
@@ -10,7 +10,7 @@ Helper classes to get and set shortcuts in Griffin.
 
 # Standard library imports
 import functools
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, Optional, Set
 
 # Third-party imports
 from qtpy.QtCore import Qt
@@ -26,6 +26,11 @@ from griffin.plugins.shortcuts.utils import (
 )
 
 
+# Set with the contents of SHORTCUTS_FOR_WIDGETS_DATA, to check if a widget
+# shortcut was already registered without scanning that list.
+_WIDGET_SHORTCUTS_DATA: Set[ShortcutData] = set(SHORTCUTS_FOR_WIDGETS_DATA)
+
+
 class GriffinShortcutsMixin(GriffinConfigurationObserver):
     """Provide methods to get, set and register shortcuts for widgets."""
 
@@ -168,7 +173,8 @@ class GriffinShortcutsMixin(GriffinConfigurationObserver):
         data = ShortcutData(
             qobject=None, name=name, context=context, plugin_name=plugin_name
         )
-        if data not in SHORTCUTS_FOR_WIDGETS_DATA:
+        if data not in _WIDGET_SHORTCUTS_DATA:
+            _WIDGET_SHORTCUTS_DATA.add(data)
             SHORTCUTS_FOR_WIDGETS_DATA.append(data)
 
     def _register_shortcut(
@@ -48,31 +48,12 @@ class GriffinDialogButtonBox(QDialogButtonBox):
             super().__init__(parent=parent)
 
         # Don't display icons on standard buttons. This is a problem on Linux
-        button_constants = [
-            QDialogButtonBox.Ok,
-            QDialogButtonBox.Open,
-            QDialogButtonBox.Save,
-            QDialogButtonBox.Cancel,
-            QDialogButtonBox.Close,
-            QDialogButtonBox.Discard,
-            QDialogButtonBox.Apply,
-            QDialogButtonBox.Reset,
-            QDialogButtonBox.RestoreDefaults,
-            QDialogButtonBox.Help,
-            QDialogButtonBox.SaveAll,
-            QDialogButtonBox.Yes,
-            QDialogButtonBox.YesToAll,
-            QDialogButtonBox.No,
-            QDialogButtonBox.NoToAll,
-            QDialogButtonBox.Abort,
-            QDialogButtonBox.Retry,
-            QDialogButtonBox.Ignore,
-        ]
-
-        for constant in button_constants:
-            button = self.button(constant)
-            if button is not None:
-                button.setIcon(QIcon())
+        # Note: Only the buttons that were actually created are visited and
+        # they all share the same empty icon.
+        empty_icon = QIcon()
+        for button in self.buttons():
+            if self.standardButton(button) != QDialogButtonBox.NoButton:
+                button.setIcon(empty_icon)
 
         # Set a reasonable spacing between buttons. This is a problem on Mac
         self.layout().setSpacing(2 * AppStyle.MarginSize)
@@ -10,10 +10,11 @@ Griffin API toolbar widgets.
 
 # Standard library imports
 from collections import OrderedDict
+import functools
+import itertools
 import os
 import sys
 from typing import Dict, List, Optional, Tuple, Union
-import uuid
 
 # Third part imports
 from qtpy.QtCore import QEvent, QObject, QSize, Qt, Signal
@@ -24,6 +25,7 @@ from qtpy.QtWidgets import (
 from griffin.api.exceptions import GriffinAPIError
 from griffin.api.translations import _
 from griffin.api.widgets.menus import GriffinMenu, GriffinMenuProxyStyle
+from griffin.config.gui import get_fonts_version
 from griffin.utils.icon_manager import ima
 from griffin.utils.qthelpers import GriffinAction
 from griffin.utils.stylesheet import (
@@ -42,6 +44,26 @@ class ToolbarLocation:
     Bottom = Qt.BottomToolBarArea
 
 
+# Counter to give main widget toolbars a unique object name
+_MAIN_WIDGET_TOOLBAR_COUNTER = itertools.count()
+
+# Toolbar stylesheets are static, so they are converted to strings only once
+_APP_TOOLBAR_QSS = str(APP_TOOLBAR_STYLESHEET)
+_PANES_TOOLBAR_QSS = str(PANES_TOOLBAR_STYLESHEET)
+
+
+# ---- Stylesheets
+# ----------------------------------------------------------------------------
+@functools.lru_cache(maxsize=1)
+def _ext_button_menu_stylesheet(fonts_version):
+    """
+    Stylesheet for the menu of toolbar extension buttons.
+
+    It depends on the interface font, so it's cached per `fonts_version`.
+    """
+    return GriffinMenu._generate_stylesheet().toString()
+
+
 # ---- Event filters
 # ----------------------------------------------------------------------------
 class ToolTipFilter(QObject):
@@ -50,11 +72,14 @@ class ToolTipFilter(QObject):
     """
 
     def eventFilter(self, obj, event):
-        event_type = event.type()
+        # Tool tips are a small fraction of the events received here, so
+        # reject the rest before doing any other check.
+        if event.type() != QEvent.ToolTip:
+            return False
+
         action = obj.defaultAction() if isinstance(obj, QToolButton) else None
-        if event_type == QEvent.ToolTip and action is not None:
-            if action.tip is None:
-                return action.text_beside_icon
+        if action is not None and action.tip is None:
+            return action.text_beside_icon
 
         return QObject.eventFilter(self, obj, event)
 
@@ -66,30 +91,27 @@ class ToolbarStyle(QProxyStyle):
     # The toolbar type. This can be 'Application' or 'MainWidget'
     TYPE = None
 
+    # Size of the toolbar extension button (in pixels) per toolbar type.
+    # Important: These values need to be updated in case we change the size
+    # of our toolbar buttons in utils/stylesheet.py. That's because Qt only
+    # allow to set them in pixels here, not em's.
+    if os.name == 'nt':
+        _EXTENSION_EXTENTS = {'Application': 40, 'MainWidget': 36}
+    elif sys.platform == 'darwin':
+        _EXTENSION_EXTENTS = {'Application': 54, 'MainWidget': 42}
+    else:
+        _EXTENSION_EXTENTS = {'Application': 57, 'MainWidget': 44}
+
     def pixelMetric(self, pm, option, widget):
         """
         Adjust size of toolbar extension button (in pixels).
 
         From https://stackoverflow.com/a/27042352/438386
         """
-        # Important: These values need to be updated in case we change the size
-        # of our toolbar buttons in utils/stylesheet.py. That's because Qt only
-        # allow to set them in pixels here, not em's.
         if pm == QStyle.PM_ToolBarExtensionExtent:
-            if self.TYPE == 'Application':
-                if os.name == 'nt':
-                    return 40
-                elif sys.platform == 'darwin':
-                    return 54
-                else:
-                    return 57
-            elif self.TYPE == 'MainWidget':
-                if os.name == 'nt':
-                    return 36
-                elif sys.platform == 'darwin':
-                    return 42
-                else:
-                    return 44
+            extent = self._EXTENSION_EXTENTS.get(self.TYPE)
+            if extent is not None:
+                return extent
             else:
                 print("Unknown toolbar style type")  # griffin: test-skip
         return super().pixelMetric(pm, option, widget)
@@ -133,7 +155,7 @@ class GriffinToolbar(QToolBar):
         # it).
         if ext_button.menu():
             ext_button.menu().setStyleSheet(
-                GriffinMenu._generate_stylesheet().toString()
+                _ext_button_menu_stylesheet(get_fonts_version())
             )
 
             ext_button_menu_style = GriffinMenuProxyStyle(None)
@@ -169,14 +191,10 @@ class GriffinToolbar(QToolBar):
             id, False otherwise. This flag exists only for items added on
             Griffin 4 plugins. Default: False
         """
-        item_id = None
-        if (
-            isinstance(action_or_widget, GriffinAction)
-            or hasattr(action_or_widget, 'action_id')
-        ):
-            item_id = action_or_widget.action_id
-        elif hasattr(action_or_widget, 'ID'):
-            item_id = action_or_widget.ID
+        # Actions declare `action_id` and widgets `ID`.
+        item_id = getattr(action_or_widget, 'action_id', None)
+        if item_id is None:
+            item_id = getattr(action_or_widget, 'ID', None)
         if not omit_id and item_id is None and action_or_widget is not None:
             raise GriffinAPIError(
                 f'Item {action_or_widget} must declare an ID attribute.'
@@ -206,26 +224,31 @@ class GriffinToolbar(QToolBar):
             self._section_items[section] = [action_or_widget]
         else:
             if before is not None:
-                new_actions_or_widgets = []
-                for act_or_wid in self._section_items[section]:
-                    if act_or_wid == before:
-                        new_actions_or_widgets.append(action_or_widget)
-                    new_actions_or_widgets.append(act_or_wid)
-
-                self._section_items[section] = new_actions_or_widgets
+                section_items = self._section_items[section]
+                try:
+                    section_items.insert(
+                        section_items.index(before), action_or_widget
+                    )
+                except ValueError:
+                    # `before` is in a different section, so there's no
+                    # position to insert the item at.
+                    pass
             else:
                 self._section_items[section].append(action_or_widget)
         if (before_section is not None and
                 before_section in self._section_items):
-            new_sections_keys = []
-            for sec in self._section_items.keys():
-                if sec == before_section:
-                    new_sections_keys.append(section)
-                if sec != section:
-                    new_sections_keys.append(sec)
-            self._section_items = OrderedDict(
-                (section_key, self._section_items[section_key])
-                for section_key in new_sections_keys)
+            # Reorder sections in place by moving `section` and the ones
+            # that follow `before_section` to the end, unless it's already
+            # right before it.
+            sections = list(self._section_items.keys())
+            index = sections.index(before_section)
+            if section != before_section and (
+                index == 0 or sections[index - 1] != section
+            ):
+                self._section_items.move_to_end(section)
+                for sec in sections[index:]:
+                    if sec != section:
+                        self._section_items.move_to_end(sec)
 
         if item_id is not None:
             self._item_map[item_id] = action_or_widget
@@ -239,51 +262,79 @@ class GriffinToolbar(QToolBar):
         """Remove action or widget from toolbar by id."""
         try:
             item = self._item_map.pop(item_id)
-            for section in list(self._section_items.keys()):
-                section_items = self._section_items[section]
-                if item in section_items:
-                    section_items.remove(item)
-                if len(section_items) == 0:
-                    self._section_items.pop(section)
-            self.clear()
-            self.render()
         except KeyError:
-            pass
+            return
+
+        section_removed = False
+        for section in list(self._section_items.keys()):
+            section_items = self._section_items[section]
+            if item in section_items:
+                section_items.remove(item)
+                section_removed = len(section_items) == 0
+            if len(section_items) == 0:
+                self._section_items.pop(section)
+
+        # Remove the item from the rendered toolbar, instead of clearing and
+        # rendering it again.
+        actions = self.actions()
+        if isinstance(item, QAction):
+            item_action = item
+        else:
+            item_action = None
+            for action in actions:
+                if self.widgetForAction(action) is item:
+                    item_action = action
+                    break
+
+        if item_action is None or item_action not in actions:
+            return
+
+        index = actions.index(item_action)
+        super().removeAction(item_action)
+
+        # Also remove the separator that was rendered next to the item's
+        # section if it's now empty.
+        if section_removed:
+            separator = None
+            if index + 1 < len(actions) and actions[index + 1].isSeparator():
+                separator = actions[index + 1]
+            elif index > 0 and actions[index - 1].isSeparator():
+                separator = actions[index - 1]
+
+            if separator is not None:
+                super().removeAction(separator)
+                separator.deleteLater()
 
     def render(self):
         """Create the toolbar taking into account sections and locations."""
-        sec_items = []
-        for sec, items in self._section_items.items():
-            for item in items:
-                sec_items.append([sec, item])
-
-            sep = QAction(self)
-            sep.setSeparator(True)
-            sec_items.append((None, sep))
-
-        if sec_items:
-            sec_items.pop()
-
-        for (sec, item) in sec_items:
-            if isinstance(item, QAction):
-                add_method = super().addAction
-            else:
-                add_method = super().addWidget
-
-            add_method(item)
-
-            if isinstance(item, QAction):
-                widget = self.widgetForAction(item)
-
-                if self._filter is not None:
-                    widget.installEventFilter(self._filter)
-
-                text_beside_icon = getattr(item, 'text_beside_icon', False)
-                if text_beside_icon:
-                    widget.setToolButtonStyle(Qt.ToolButtonTextBesideIcon)
-
-                if item.isCheckable():
-                    widget.setCheckable(True)
+        # Items of all sections, with a separator between consecutive ones
+        items = []
+        for section_items in self._section_items.values():
+            if items:
+                sep = QAction(self)
+                sep.setSeparator(True)
+                items.append(sep)
+            items.extend(section_items)
+
+        add_action = super().addAction
+        add_widget = super().addWidget
+        event_filter = self._filter
+        for item in items:
+            if not isinstance(item, QAction):
+                add_widget(item)
+                continue
+
+            add_action(item)
+            widget = self.widgetForAction(item)
+
+            if event_filter is not None:
+                widget.installEventFilter(event_filter)
+
+            if getattr(item, 'text_beside_icon', False):
+                widget.setToolButtonStyle(Qt.ToolButtonTextBesideIcon)
+
+            if item.isCheckable():
+                widget.setCheckable(True)
 
         self.sig_is_rendered.emit()
 
@@ -309,7 +360,7 @@ class ApplicationToolbar(GriffinToolbar):
         self._style.setParent(self)
         self.setStyle(self._style)
 
-        self.setStyleSheet(str(APP_TOOLBAR_STYLESHEET))
+        self.setStyleSheet(_APP_TOOLBAR_QSS)
 
     def __str__(self):
         return f"ApplicationToolbar('{self.ID}')"
@@ -336,8 +387,8 @@ class MainWidgetToolbar(GriffinToolbar):
         self._icon_size = QSize(16, 16)
 
         # Setup
-        self.setObjectName("main_widget_toolbar_{}".format(
-            str(uuid.uuid4())[:8]))
+        self.setObjectName("main_widget_toolbar_{:08x}".format(
+            next(_MAIN_WIDGET_TOOLBAR_COUNTER)))
         self.setFloatable(False)
         self.setMovable(False)
         self.setContextMenuPolicy(Qt.PreventContextMenu)
@@ -348,7 +399,7 @@ class MainWidgetToolbar(GriffinToolbar):
         self._style.setParent(self)
         self.setStyle(self._style)
 
-        self.setStyleSheet(str(PANES_TOOLBAR_STYLESHEET))
+        self.setStyleSheet(_PANES_TOOLBAR_QSS)
 
         self._filter = ToolTipFilter()
 
@@ -9,7 +9,6 @@ Griffin Boilerplate Plugin.
 """
 
 # Third party imports
-import qtawesome as qta
 from qtpy.QtWidgets import QHBoxLayout, QTextEdit
 
 # Griffin imports
@@ -162,6 +161,9 @@ class GriffinBoilerplate(GriffinDockablePlugin):
 
     @staticmethod
     def get_icon():
+        # Imported here so that qtawesome is not loaded when the plugin is
+        # only being discovered.
+        import qtawesome as qta
         return qta.icon('mdi6.alpha-b-box', color=GriffinPalette.ICON_1)
 
     def on_initialize(self):
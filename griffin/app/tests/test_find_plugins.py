@@ -33,7 +33,7 @@ def test_find_internal_plugins():
     assert len(expected_names) == len(internal_plugins.values())
 
     # Names must be the same
-    assert sorted(expected_names) == sorted(list(internal_plugins.keys()))
+    assert set(expected_names) == set(internal_plugins)
 
 
 @pytest.mark.skipif(not running_in_ci(), reason="Only works in CIs")
@@ -60,7 +60,7 @@ def test_find_external_plugins():
         assert name not in internal_names
 
     # Names must be the expected ones.
-    assert sorted(expected_names) == sorted(list(external_plugins.keys()))
+    assert set(expected_names) == set(external_plugins)
 
     # Assert special attributes are present
     for name in external_plugins.keys():
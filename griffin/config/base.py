@@ -300,8 +300,7 @@ def get_conf_paths():
         tmpfolder = str(tempfile.gettempdir())
         for i in range(3):
             path = os.path.join(tmpfolder, 'site-config-' + str(i))
-            if not os.path.isdir(path):
-                os.makedirs(path)
+            os.makedirs(path, exist_ok=True)
             search_paths.append(path)
         SEARCH_PATH = tuple(search_paths)
 
@@ -14,6 +14,9 @@ Important note regarding shortcuts:
         Ctrl + Alt + Q, W, F, G, Y, X, C, V, B, N
 """
 
+# Standard library imports
+import functools
+
 # Third party imports
 from qtconsole.styles import dark_color
 from qtpy import QT_VERSION
@@ -25,54 +28,93 @@ from griffin.py3compat import to_text_string
 from griffin.utils import syntaxhighlighters as sh
 
 
+@functools.lru_cache(maxsize=1)
+def _installed_families():
+    """Return the set of installed font families."""
+    db = QFontDatabase() if QT_VERSION.startswith("5") else QFontDatabase
+    return frozenset(str(fam) for fam in db.families())
+
+
 def font_is_installed(font):
     """Check if font is installed"""
-    db = QFontDatabase() if QT_VERSION.startswith("5") else QFontDatabase
-    return [fam for fam in db.families() if str(fam) == font]
+    return font in _installed_families()
 
 
 def get_family(families):
     """Return the first installed font family in family list"""
     if not isinstance(families, list):
         families = [ families ]
+    installed_families = _installed_families()
     for family in families:
-        if font_is_installed(family):
+        if family in installed_families:
             return family
     else:
         print("Warning: None of the following fonts is installed: %r" % families)  # griffin: test-skip
         return QFont().family()
 
 
-FONT_CACHE = {}
+# Version of the font options saved in our config system. It's increased
+# every time one of them changes, so that fonts cached out of this module can
+# be invalidated.
+_FONTS_VERSION = 0
 
-def get_font(section='appearance', option='font', font_size_delta=0):
-    """Get console font properties depending on OS and user options"""
-    font = FONT_CACHE.get((section, option, font_size_delta))
+# Options of the `appearance` section that define the fonts returned by
+# get_font. They correspond to the GriffinFontType values in
+# griffin/api/fonts.py.
+_FONT_OPTIONS = [
+    f"{font_type}/{prop}"
+    for font_type in ('font', 'app_font', 'monospace_app_font')
+    for prop in ('family', 'size', 'italic', 'bold')
+]
 
-    if font is None:
-        families = CONF.get(section, option+"/family", None)
 
-        if families is None:
-            return QFont()
+def get_fonts_version():
+    """Return the current version of the font options."""
+    return _FONTS_VERSION
 
-        family = get_family(families)
-        weight = QFont.Normal
-        italic = CONF.get(section, option+'/italic', False)
 
-        if CONF.get(section, option+'/bold', False):
-            weight = QFont.Bold
+class _FontOptionsObserver:
+    """
+    Increase the fonts version and clear the fonts cache when a font option
+    changes.
+    """
 
-        size = CONF.get(section, option+'/size', 9) + font_size_delta
-        font = QFont(family, size, weight)
-        font.setItalic(italic)
-        FONT_CACHE[(section, option, font_size_delta)] = font
+    def on_configuration_change(self, option, section, value):
+        global _FONTS_VERSION
+        _FONTS_VERSION += 1
+        _build_font.cache_clear()
+
+
+@functools.lru_cache(maxsize=64)
+def _build_font(section, option, font_size_delta):
+    """Build a font from the properties saved in our config system."""
+    families = CONF.get(section, option+"/family", None)
+
+    if families is None:
+        return QFont()
+
+    family = get_family(families)
+    weight = QFont.Normal
+    italic = CONF.get(section, option+'/italic', False)
+
+    if CONF.get(section, option+'/bold', False):
+        weight = QFont.Bold
 
     size = CONF.get(section, option+'/size', 9) + font_size_delta
+    font = QFont(family, size, weight)
+    font.setItalic(italic)
     if size > 0:
         font.setPointSize(size)
     return font
 
 
+def get_font(section='appearance', option='font', font_size_delta=0):
+    """Get console font properties depending on OS and user options"""
+    # Return a copy so that callers changing the font (e.g. its size) don't
+    # alter the cached one.
+    return QFont(_build_font(section, option, font_size_delta))
+
+
 def set_font(font, section='appearance', option='font'):
     """Set font properties in our config system."""
     CONF.set(section, option+'/family', to_text_string(font.family()))
@@ -80,11 +122,9 @@ def set_font(font, section='appearance', option='font'):
     CONF.set(section, option+'/italic', int(font.italic()))
     CONF.set(section, option+'/bold', int(font.bold()))
 
-    # This function is only used to set fonts that were changed through
-    # Preferences. And in that case it's not possible to set a delta.
-    font_size_delta = 0
-
-    FONT_CACHE[(section, option, font_size_delta)] = font
+    # Fonts are rebuilt from the options set above the next time they are
+    # requested.
+    _build_font.cache_clear()
 
 
 def get_color_scheme(name):
@@ -106,9 +146,10 @@ def set_color_scheme(name, color_scheme, replace=True):
         option = "%s/%s" % (name, key)
         value = CONF.get(section, option, default=None)
         if value is None or replace or name not in names:
-            CONF.set(section, option, color_scheme[key])
-    names.append(to_text_string(name))
-    CONF.set(section, "names", sorted(list(set(names))))
+            CONF.set(section, option, color_scheme[key], save=False)
+
+    # This saves the options set above too
+    CONF.set(section, "names", sorted(set(names) | {to_text_string(name)}))
 
 
 def set_default_color_scheme(name, replace=True):
@@ -138,5 +179,39 @@ def is_dark_interface():
         return False
 
 
-for _name in sh.COLOR_SCHEME_NAMES:
-    set_default_color_scheme(_name, replace=False)
+def _bootstrap_default_color_schemes():
+    """
+    Add the default color schemes that are missing in our config system.
+
+    This is equivalent to calling `set_default_color_scheme(name,
+    replace=False)` for every default scheme, but the config file is only
+    written once, after setting all missing options.
+    """
+    section = "appearance"
+    names = CONF.get(section, "names", [])
+
+    pending = {}
+    for name in sh.COLOR_SCHEME_NAMES:
+        color_scheme = sh.get_color_scheme(name)
+        for key in sh.COLOR_SCHEME_KEYS:
+            option = "%s/%s" % (name, key)
+            value = CONF.get(section, option, default=None)
+            if value is None or name not in names:
+                pending[option] = color_scheme[key]
+
+    new_names = sorted(set(names) | set(sh.COLOR_SCHEME_NAMES))
+    if new_names != names:
+        pending["names"] = new_names
+
+    last_option = list(pending)[-1] if pending else None
+    for option, value in pending.items():
+        CONF.set(section, option, value, save=(option == last_option))
+
+
+_bootstrap_default_color_schemes()
+
+# Note: This is registered after setting the default color schemes above to
+# not increase the fonts version needlessly on import.
+_FONT_OPTIONS_OBSERVER = _FontOptionsObserver()
+for _option in _FONT_OPTIONS:
+    CONF.observe_configuration(_FONT_OPTIONS_OBSERVER, 'appearance', _option)
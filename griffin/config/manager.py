@@ -9,20 +9,21 @@ Configuration manager providing access to user/site/project configuration.
 """
 
 # Standard library imports
+from contextlib import contextmanager
 import logging
 import os
 import os.path as osp
 import sys
 import traceback
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Optional, Set, Tuple
 import weakref
 
 # Third-party imports
 import keyring
+from keyring.backends.fail import Keyring as FailKeyring
 from keyring.errors import NoKeyringError
 
 # Local imports
-from griffin.api.utils import PrefixedTuple
 from griffin.config.base import (
     _, get_conf_paths, get_conf_path, get_home_dir, reset_config_files)
 from griffin.config.main import CONF_VERSION, DEFAULTS, NAME_MAP
@@ -48,8 +49,7 @@ class ConfigurationManager(object):
         Configuration manager to provide access to user/site/project config.
         """
         path = conf_path if conf_path else self.get_user_config_path()
-        if not osp.isdir(path):
-            os.makedirs(path)
+        os.makedirs(path, exist_ok=True)
 
         # Site configuration defines the system defaults if a file
         # is found in the site location
@@ -88,8 +88,18 @@ class ConfigurationManager(object):
         self.old_griffin_version = (
             self._user_config._configs_map['griffin']._old_version)
 
-        # Store plugin configurations when CONF_FILE = True
-        self._plugin_configs = {}
+        # Whether external plugin configs need to be recreated when they're
+        # registered. This doesn't change after startup, so it's only
+        # checked once.
+        self._recreate_plugin_configs = check_version(
+            self.old_griffin_version, '54.0.0', '<')
+
+        # Store plugin configurations when CONF_FILE = True.
+        # This maps plugin sections to (plugin_class, config) pairs, where
+        # config is None until it's requested for the first time.
+        self._plugin_configs: Dict[
+            str, Tuple[type, Optional[MultiUserConfig]]
+        ] = {}
 
         # TODO: To be implemented in following PR
         self._project_configs = {}  # Cache project configurations
@@ -109,38 +119,110 @@ class ConfigurationManager(object):
             ConfigurationObserver, Dict[str, Set[ConfigurationKey]]
         ] = weakref.WeakKeyDictionary()
 
-        # List of options with disabled notifications.
-        # This holds a list of (section, option) options that won't be notified
+        # Set of options with disabled notifications.
+        # This holds a set of (section, option) options that won't be notified
         # to observers. It can be used to temporarily disable notifications for
         # some options.
-        self._disabled_options: List[Tuple(str, ConfigurationKey)] = []
+        self._disabled_options: Set[Tuple[str, ConfigurationKey]] = set()
 
         # Mapping for shortcuts that need to be notified
-        self._shortcuts_to_notify: Dict[(str, str), Optional[str]] = {}
+        self._shortcuts_to_notify: Dict[Tuple[str, str], Optional[str]] = {}
+
+        # Number of entries of SHORTCUTS_FOR_WIDGETS_DATA already added to
+        # the mapping above
+        self._shortcuts_to_notify_count = 0
+
+        # Sections with options set without saving them to disk
+        self._unsaved_sections: Set[str] = set()
+
+        # Notifications waiting to be sent while they are batched.
+        # This maps (section, option) pairs to the last
+        # (recursive_notification, secure) arguments passed to
+        # `notify_observers` for them.
+        self._pending_notifications: Dict[
+            Tuple[str, ConfigurationKey], Tuple[bool, bool]
+        ] = {}
+
+        # Depth of nested `batch_notifications` contexts
+        self._notifications_batch_depth = 0
+
+        # Options set while saves are batched, which need to be written to
+        # disk when the batch ends.
+        self._pending_saves: Dict[Tuple[str, str], MultiUserConfig] = {}
+
+        # Depth of nested `batch_saves` contexts
+        self._saves_batch_depth = 0
+
+        # Whether there's a keyring backend to save secure options with. This
+        # is checked the first time a secure option is used.
+        self._secure_enabled: Optional[bool] = None
 
         # Setup
         self.remove_deprecated_config_locations()
 
     def unregister_plugin(self, plugin_instance):
-        conf_section = plugin_instance.CONF_SECTION
-        if conf_section in self._plugin_configs:
-            self._plugin_configs.pop(conf_section, None)
+        self._plugin_configs.pop(plugin_instance.CONF_SECTION, None)
 
     def register_plugin(self, plugin_class):
-        """Register plugin configuration."""
+        """
+        Register plugin configuration.
+
+        The configuration files of the plugin are only read when its config
+        is requested for the first time.
+        """
         conf_section = plugin_class.CONF_SECTION
         if plugin_class.CONF_FILE and conf_section:
-            path = self.get_plugin_config_path(conf_section)
-            version = plugin_class.CONF_VERSION
-            version = version if version else '0.0.0'
-            name_map = plugin_class._CONF_NAME_MAP
-            name_map = name_map if name_map else {'griffin': []}
-            defaults = plugin_class.CONF_DEFAULTS
-
             if conf_section in self._plugin_configs:
                 raise RuntimeError('A plugin with section "{}" already '
                                    'exists!'.format(conf_section))
 
+            self._plugin_configs[conf_section] = (plugin_class, None)
+
+    def _get_plugin_config(self, conf_section):
+        """
+        Return the (plugin_class, config) pair registered for `conf_section`.
+
+        The plugin config is created here if needed.
+        """
+        plugin_class, plugin_config = self._plugin_configs[conf_section]
+        if plugin_config is None:
+            plugin_config = self._create_plugin_config(plugin_class)
+            self._plugin_configs[conf_section] = (plugin_class, plugin_config)
+
+        return plugin_class, plugin_config
+
+    def _create_plugin_config(self, plugin_class):
+        """Create the configuration of a plugin with CONF_FILE = True."""
+        conf_section = plugin_class.CONF_SECTION
+        path = self.get_plugin_config_path(conf_section)
+        version = plugin_class.CONF_VERSION
+        version = version if version else '0.0.0'
+        name_map = plugin_class._CONF_NAME_MAP
+        name_map = name_map if name_map else {'griffin': []}
+        defaults = plugin_class.CONF_DEFAULTS
+
+        plugin_config = MultiUserConfig(
+            name_map,
+            path=path,
+            defaults=defaults,
+            load=True,
+            version=version,
+            backup=True,
+            raw_mode=True,
+            remove_obsolete=False,
+            external_plugin=True
+        )
+
+        # Recreate external plugin configs to deal with part two
+        # (the shortcut conflicts) of griffin-ide/griffin#11132
+        if self._recreate_plugin_configs:
+            # Remove all previous .ini files
+            try:
+                plugin_config.cleanup()
+            except EnvironmentError:
+                pass
+
+            # Recreate config
             plugin_config = MultiUserConfig(
                 name_map,
                 path=path,
@@ -153,29 +235,7 @@ class ConfigurationManager(object):
                 external_plugin=True
             )
 
-            # Recreate external plugin configs to deal with part two
-            # (the shortcut conflicts) of griffin-ide/griffin#11132
-            if check_version(self.old_griffin_version, '54.0.0', '<'):
-                # Remove all previous .ini files
-                try:
-                    plugin_config.cleanup()
-                except EnvironmentError:
-                    pass
-
-                # Recreate config
-                plugin_config = MultiUserConfig(
-                    name_map,
-                    path=path,
-                    defaults=defaults,
-                    load=True,
-                    version=version,
-                    backup=True,
-                    raw_mode=True,
-                    remove_obsolete=False,
-                    external_plugin=True
-                )
-
-            self._plugin_configs[conf_section] = (plugin_class, plugin_config)
+        return plugin_config
 
     def remove_deprecated_config_locations(self):
         """Removing old .griffin.ini location."""
@@ -191,7 +251,7 @@ class ConfigurationManager(object):
         if section is None:
             config = self._user_config
         elif section in self._plugin_configs:
-            _, config = self._plugin_configs[section]
+            _, config = self._get_plugin_config(section)
         else:
             # TODO: implement project configuration on the following PR
             config = self._user_config
@@ -202,20 +262,16 @@ class ConfigurationManager(object):
         """Return the user configuration path."""
         base_path = get_conf_path()
         path = osp.join(base_path, 'config')
-        if not osp.isdir(path):
-            os.makedirs(path)
+        os.makedirs(path, exist_ok=True)
 
         return path
 
     def get_plugin_config_path(self, plugin_folder):
         """Return the plugin configuration path."""
-        base_path = get_conf_path()
-        path = osp.join(base_path, 'plugins')
         if plugin_folder is None:
             raise RuntimeError('Plugin needs to define `CONF_SECTION`!')
-        path = osp.join(base_path, 'plugins', plugin_folder)
-        if not osp.isdir(path):
-            os.makedirs(path)
+        path = osp.join(get_conf_path(), 'plugins', plugin_folder)
+        os.makedirs(path, exist_ok=True)
 
         return path
 
@@ -242,21 +298,24 @@ class ConfigurationManager(object):
             will observe any changes on any of the options of the configuration
             section.
         """
-        section_sets = self._observers.get(section, {})
         option = option if option is not None else '__section'
 
-        option_set = section_sets.get(option, weakref.WeakSet())
-        option_set |= {observer}
-
-        section_sets[option] = option_set
-        self._observers[section] = section_sets
+        # Intern keys so that lookups with interned strings during
+        # notifications can be resolved by identity.
+        section = sys.intern(section)
+        if isinstance(option, str):
+            option = sys.intern(option)
 
-        observer_section_sets = self._observer_map_keys.get(observer, {})
-        section_set = observer_section_sets.get(section, set({}))
-        section_set |= {option}
+        section_sets = self._observers.setdefault(section, {})
+        option_set = section_sets.get(option)
+        if option_set is None:
+            option_set = section_sets[option] = weakref.WeakSet()
+        option_set.add(observer)
 
-        observer_section_sets[section] = section_set
-        self._observer_map_keys[observer] = observer_section_sets
+        observer_section_sets = self._observer_map_keys.get(observer)
+        if observer_section_sets is None:
+            observer_section_sets = self._observer_map_keys[observer] = {}
+        observer_section_sets.setdefault(section, set()).add(option)
 
     def unobserve_configuration(self,
                                 observer: ConfigurationObserver,
@@ -339,7 +398,110 @@ class ConfigurationManager(object):
         secure: bool
             Whether this is a secure option or not.
         """
-        if recursive_notification:
+        if self._notifications_batch_depth > 0:
+            key = (section, option)
+            if key in self._pending_notifications:
+                previous_recursive, __ = self._pending_notifications[key]
+                recursive_notification |= previous_recursive
+            self._pending_notifications[key] = (recursive_notification, secure)
+            return
+
+        self._notify_observers(
+            section, option, recursive_notification, secure
+        )
+
+    @contextmanager
+    def batch_notifications(self):
+        """
+        Context manager to batch the notifications sent to observers.
+
+        Notifications requested inside this context are sent when the
+        outermost one exits, once per option and section. Options that were
+        removed by then are skipped.
+        """
+        self._notifications_batch_depth += 1
+        try:
+            yield
+        finally:
+            self._notifications_batch_depth -= 1
+            if self._notifications_batch_depth == 0:
+                self._flush_notifications()
+
+    @contextmanager
+    def batch_saves(self):
+        """
+        Context manager to batch writing config files to disk.
+
+        Options set inside this context are only changed in memory. The
+        files that hold them are written once when the outermost context
+        exits.
+        """
+        self._saves_batch_depth += 1
+        try:
+            yield
+        finally:
+            self._saves_batch_depth -= 1
+            if self._saves_batch_depth == 0:
+                self._flush_saves()
+
+    def _flush_saves(self):
+        """Write the config files of options set inside `batch_saves`."""
+        pending = self._pending_saves
+        self._pending_saves = {}
+
+        # Several options can be stored in the same file, so save each one
+        # only once
+        saved_configs = []
+        for (section, option), config in pending.items():
+            user_config = config._get_config(section, option)
+            if user_config not in saved_configs:
+                user_config._save()
+                saved_configs.append(user_config)
+
+            self._unsaved_sections.discard(section)
+
+    def _flush_notifications(self):
+        """Send the notifications batched by `batch_notifications`."""
+        pending = self._pending_notifications
+        self._pending_notifications = {}
+
+        # Notify section observers first and only once per section
+        sections = []
+        for (section, option), (recursive, __) in pending.items():
+            if (
+                (recursive or option == '__section')
+                and section not in sections
+            ):
+                sections.append(section)
+
+        for section in sections:
+            self._notify_section(section)
+
+        for (section, option), (recursive, secure) in pending.items():
+            if option == '__section':
+                continue
+
+            try:
+                self._notify_observers(
+                    section, option, recursive, secure, notify_section=False
+                )
+            except cp.NoOptionError:
+                pass
+
+    def _notify_observers(
+        self,
+        section: str,
+        option: ConfigurationKey,
+        recursive_notification: bool = True,
+        secure: bool = False,
+        notify_section: bool = True,
+    ):
+        # Values are only read for options that are observed, so there's
+        # nothing to do for sections without observers.
+        if not self._observers.get(section):
+            return
+
+        if recursive_notification and notify_section:
             # Notify to section listeners
             self._notify_section(section)
 
@@ -348,42 +510,80 @@ class ConfigurationManager(object):
             # e.g., If the option is (a, b, c), observers subscribed to
             # (a, b, c), (a, b) and a are notified
             option_list = list(option)
+            nested_values = None
             while option_list != []:
                 tuple_option = tuple(option_list)
                 if len(option_list) == 1:
                     tuple_option = tuple_option[0]
 
-                value = self.get(section, tuple_option)
-                self._notify_option(section, tuple_option, value)
+                if self._has_observers(section, tuple_option):
+                    if len(option_list) == 1:
+                        value = self.get(section, tuple_option)
+                    else:
+                        # Walk the nested option only once for all prefixes
+                        if nested_values is None:
+                            nested_values = self._get_nested_values(
+                                section, option)
+                        value = nested_values[len(option_list) - 1]
+                        if value is None:
+                            raise cp.NoOptionError(tuple_option, section)
+
+                    self._notify_option(section, tuple_option, value)
                 option_list.pop(-1)
         else:
             if option == '__section':
-                self._notify_section(section)
-            else:
+                if notify_section:
+                    self._notify_section(section)
+            elif self._has_observers(section, option):
                 if section == "shortcuts":
                     self._notify_shortcut(option)
                 else:
                     value = self.get(section, option, secure=secure)
                     self._notify_option(section, option, value)
 
+    def _get_nested_values(self, section: str, option: Tuple[str, ...]):
+        """
+        Return the values of all the prefixes of the tuple `option`.
+
+        The value at position `i` corresponds to the prefix `option[:i + 1]`,
+        and is None if it's not present.
+        """
+        value = self.get(section, option[0], {})
+        values = [value]
+        for key in option[1:]:
+            value = value.get(key) if isinstance(value, dict) else None
+            values.append(value)
+        return values
+
+    def _has_observers(self, section: str, option: ConfigurationKey) -> bool:
+        """Check if `option` in `section` has any observer."""
+        return bool(self._observers.get(section, {}).get(option))
+
     def _notify_option(self, section: str, option: ConfigurationKey,
                        value: Any):
         section_observers = self._observers.get(section, {})
-        option_observers = section_observers.get(option, set({}))
+        option_observers = section_observers.get(option)
+        if not option_observers:
+            return
 
-        if (section, option) in self._disabled_options:
+        if (
+            self._disabled_options
+            and (section, option) in self._disabled_options
+        ):
             logger.debug(
                 f"Don't send notification to observers of disabled option "
                 f"{option} in configuration section {section}"
             )
             return
-        elif len(option_observers) > 0:
-            logger.debug(
-                f"Sending notification to observers of {option} option in "
-                f"configuration section {section}"
-            )
 
-        for observer in list(option_observers):
+        logger.debug(
+            f"Sending notification to observers of {option} option in "
+            f"configuration section {section}"
+        )
+
+        # Iterate over a snapshot because observers can (un)observe options
+        # while being notified, and dead ones are unobserved below.
+        for observer in tuple(option_observers):
             try:
                 observer.on_configuration_change(option, section, value)
             except RuntimeError:
@@ -391,6 +591,9 @@ class ConfigurationManager(object):
                 self.unobserve_configuration(observer)
 
     def _notify_section(self, section: str):
+        if not self._has_observers(section, '__section'):
+            return
+
         section_values = dict(self.items(section) or [])
         self._notify_option(section, '__section', section_values)
 
@@ -402,42 +605,58 @@ class ConfigurationManager(object):
         # 2. Besides context and name, we need the plugin_name to correctly get
         #    the shortcut value to notify. That's not saved in our config
         #    system, but it is in SHORTCUTS_FOR_WIDGETS_DATA.
-        if not self._shortcuts_to_notify:
-            # Populate mapping only once
-            self._shortcuts_to_notify = {
-                (data.context, data.name): data.plugin_name
-                for data in SHORTCUTS_FOR_WIDGETS_DATA
-            }
-
-        context, name = option.split("/")
-        if (context, name) in self._shortcuts_to_notify:
+        # Widget shortcuts are registered while Griffin starts and plugins
+        # are loaded, so only add the ones registered since the last call.
+        count = len(SHORTCUTS_FOR_WIDGETS_DATA)
+        if count != self._shortcuts_to_notify_count:
+            for data in SHORTCUTS_FOR_WIDGETS_DATA[
+                self._shortcuts_to_notify_count:
+            ]:
+                self._shortcuts_to_notify[(data.context, data.name)] = (
+                    data.plugin_name
+                )
+            self._shortcuts_to_notify_count = count
+
+        context, sep, name = option.partition("/")
+        if not sep:
+            return
+
+        try:
             plugin_name = self._shortcuts_to_notify[(context, name)]
-            value = self.get_shortcut(context, name, plugin_name)
-            self._notify_option("shortcuts", option, value)
+        except KeyError:
+            return
+
+        value = self.get_shortcut(context, name, plugin_name)
+        self._notify_option("shortcuts", option, value)
 
     def notify_section_all_observers(self, section: str):
         """Notify all the observers subscribed to any option of a section."""
         option_observers = self._observers[section]
-        section_prefix = PrefixedTuple()
-        # Notify section observers
-        CONF.notify_observers(section, '__section')
-        for option in option_observers:
-            if isinstance(option, tuple):
-                section_prefix.add_path(option)
-            else:
+        # Prefixes of tuple options, in the order they were found. A dict
+        # is used to skip the ones shared by several options.
+        section_prefixes: Dict[Tuple[str, ...], None] = {}
+        with self.batch_notifications():
+            # Notify section observers
+            self.notify_observers(section, '__section')
+            for option in option_observers:
+                if isinstance(option, tuple):
+                    for i in range(1, len(option) + 1):
+                        section_prefixes[option[:i]] = None
+                else:
+                    try:
+                        self.notify_observers(section, option)
+                    except cp.NoOptionError:
+                        # Skip notification if the option/section does not
+                        # exist. This prevents unexpected errors in the test
+                        # suite.
+                        pass
+            # Notify prefixed observers
+            for prefix in section_prefixes:
                 try:
-                    self.notify_observers(section, option)
+                    self.notify_observers(section, prefix)
                 except cp.NoOptionError:
-                    # Skip notification if the option/section does not exist.
-                    # This prevents unexpected errors in the test suite.
+                    # See above explanation.
                     pass
-        # Notify prefixed observers
-        for prefix in section_prefix:
-            try:
-                self.notify_observers(section, prefix)
-            except cp.NoOptionError:
-                # See above explanation.
-                pass
 
     def disable_notifications(self, section: str, option: ConfigurationKey):
         """Disable notitications for `option` in `section`."""
@@ -445,7 +664,7 @@ class ConfigurationManager(object):
             f"Disable notifications for option {option} option in section "
             f"{section}"
         )
-        self._disabled_options.append((section, option))
+        self._disabled_options.add((section, option))
 
     def restore_notifications(self, section: str, option: ConfigurationKey):
         """Restore notitications for disabled `option` in `section`."""
@@ -453,10 +672,7 @@ class ConfigurationManager(object):
             f"Restore notifications for option {option} option in section "
             f"{section}"
         )
-        try:
-            self._disabled_options.remove((section, option))
-        except ValueError:
-            pass
+        self._disabled_options.discard((section, option))
 
     # --- Projects
     # ------------------------------------------------------------------------
@@ -486,11 +702,27 @@ class ConfigurationManager(object):
     def get_project_config_path(self, project_root):
         """Return the project configuration path."""
         path = osp.join(project_root, '.spyproj', 'config')
-        if not osp.isdir(path):
-            os.makedirs(path)
+        os.makedirs(path, exist_ok=True)
+
+        return path
 
     # MultiUserConf/UserConf interface
     # ------------------------------------------------------------------------
+    @staticmethod
+    def _get_nested_dict(nested, keys, create=False):
+        """
+        Return the dictionary found by following `keys` in the `nested` one.
+
+        If `create` is True, missing dictionaries are added on the way.
+        Otherwise, a KeyError is raised for them.
+        """
+        for key in keys:
+            if create:
+                nested = nested.setdefault(key, {})
+            else:
+                nested = nested[key]
+        return nested
+
     def items(self, section):
         """Return all the items option/values for the given section."""
         config = self.get_active_conf(section)
@@ -518,9 +750,11 @@ class ConfigurationManager(object):
 
             base_conf = config.get(
                 section=section, option=base_option, default={})
-            next_ptr = base_conf
-            for opt in intermediate_options:
-                next_ptr = next_ptr.get(opt, {})
+            try:
+                next_ptr = self._get_nested_dict(
+                    base_conf, intermediate_options)
+            except KeyError:
+                next_ptr = {}
 
             value = next_ptr.get(last_option, None)
             if value is None:
@@ -533,7 +767,10 @@ class ConfigurationManager(object):
                     f"Retrieving option {option} with keyring because it "
                     f"was marked as secure."
                 )
-                value = keyring.get_password(section, option)
+                if self._is_secure_enabled():
+                    value = keyring.get_password(section, option)
+                else:
+                    value = None
 
                 # This happens when `option` was not actually saved by keyring
                 if value is None:
@@ -551,7 +788,36 @@ class ConfigurationManager(object):
         Set an `option` on a given `section`.
 
         If section is None, the `option` is added to the default section.
+        Nothing is written nor notified if `option` already has `value`,
+        unless `notification` is False.
         """
+        # Sections with changes set with `save=False` need to be saved even
+        # if the value is the same. When saves are batched, that's done when
+        # the batch finishes.
+        batched_save = save and self._saves_batch_depth
+        if (
+            notification
+            and not secure
+            and (
+                batched_save
+                or not (save and section in self._unsaved_sections)
+            )
+        ):
+            try:
+                current_value = self.get(section, option)
+            except cp.Error:
+                pass
+            else:
+                if current_value == value:
+                    if batched_save and section in self._unsaved_sections:
+                        base_option = (
+                            option[0] if isinstance(option, tuple) else option
+                        )
+                        self._pending_saves[(section, base_option)] = (
+                            self.get_active_conf(section)
+                        )
+                    return
+
         original_option = option
         if isinstance(option, tuple):
             base_option = option[0]
@@ -559,11 +825,8 @@ class ConfigurationManager(object):
             last_option = option[-1]
 
             base_conf = self.get(section, base_option, {})
-            conf_ptr = base_conf
-            for opt in intermediate_options:
-                next_ptr = conf_ptr.get(opt, {})
-                conf_ptr[opt] = next_ptr
-                conf_ptr = next_ptr
+            conf_ptr = self._get_nested_dict(
+                base_conf, intermediate_options, create=True)
 
             conf_ptr[last_option] = value
             value = base_conf
@@ -571,6 +834,11 @@ class ConfigurationManager(object):
 
         config = self.get_active_conf(section)
 
+        # Write the option to disk later if saves are batched
+        if save and not secure and self._saves_batch_depth:
+            self._pending_saves[(section, option)] = config
+            save = False
+
         if secure:
             logger.debug(
                 f"Saving option {option} with keyring because it was marked "
@@ -579,30 +847,14 @@ class ConfigurationManager(object):
 
             # Catch error when there's no keyring backend available.
             # Fixes griffin-ide/griffin#22623
-            try:
-                keyring.set_password(section, option, value)
-            except NoKeyringError:
-                # This file must not have top-level Qt imports. This also
-                # prevents possible circular imports.
-                from qtpy.QtWidgets import QMessageBox
-                from griffin_kernels.utils.pythonenv import is_conda_env
-
-                pkg_manager = "conda" if is_conda_env(sys.prefix) else "pip"
-                msg = _(
-                    "It was not possible to save a configuration setting "
-                    "securely. A possible solution is to install the "
-                    "<tt>keyrings.alt</tt> package with {}.<br><br>"
-                    "<bb>Note</bb>: That package may have security risks or "
-                    "other implications. Hence, it's not advised to use it in "
-                    "general production or security-sensitive systems."
-                ).format(pkg_manager)
-
-                QMessageBox.critical(
-                    None,
-                    _("Error"),
-                    msg,
-                    QMessageBox.Ok,
-                )
+            if self._is_secure_enabled():
+                try:
+                    keyring.set_password(section, option, value)
+                except NoKeyringError:
+                    self._secure_enabled = False
+
+            if not self._secure_enabled:
+                self._show_no_keyring_error()
         else:
             config.set(
                 section=section,
@@ -612,11 +864,53 @@ class ConfigurationManager(object):
                 save=save,
             )
 
+            if save:
+                self._unsaved_sections.discard(section)
+            else:
+                self._unsaved_sections.add(section)
+
         if notification:
             self.notify_observers(
                 section, original_option, recursive_notification, secure
             )
 
+    def _is_secure_enabled(self):
+        """
+        Check if there's a keyring backend available to handle secure options.
+
+        The check is only done once because the backend is selected by
+        keyring when it's imported.
+        """
+        if self._secure_enabled is None:
+            self._secure_enabled = not isinstance(
+                keyring.get_keyring(), FailKeyring
+            )
+        return self._secure_enabled
+
+    def _show_no_keyring_error(self):
+        """Tell users that secure options can't be saved."""
+        # This file must not have top-level Qt imports. This also
+        # prevents possible circular imports.
+        from qtpy.QtWidgets import QMessageBox
+        from griffin_kernels.utils.pythonenv import is_conda_env
+
+        pkg_manager = "conda" if is_conda_env(sys.prefix) else "pip"
+        msg = _(
+            "It was not possible to save a configuration setting "
+            "securely. A possible solution is to install the "
+            "<tt>keyrings.alt</tt> package with {}.<br><br>"
+            "<bb>Note</bb>: That package may have security risks or "
+            "other implications. Hence, it's not advised to use it in "
+            "general production or security-sensitive systems."
+        ).format(pkg_manager)
+
+        QMessageBox.critical(
+            None,
+            _("Error"),
+            msg,
+            QMessageBox.Ok,
+        )
+
     def get_default(self, section, option):
         """
         Get Default value for a given `section` and `option`.
@@ -630,9 +924,8 @@ class ConfigurationManager(object):
             last_option = option[-1]
 
             base_default = config.get_default(section, base_option)
-            conf_ptr = base_default
-            for opt in intermediate_options:
-                conf_ptr = conf_ptr[opt]
+            conf_ptr = self._get_nested_dict(
+                base_default, intermediate_options)
 
             return conf_ptr[last_option]
 
@@ -662,9 +955,7 @@ class ConfigurationManager(object):
 
             # Get reference to the actual dictionary containing the option
             # that needs to be removed
-            conf_ptr = base_conf
-            for opt in intermediate_options:
-                conf_ptr = conf_ptr[opt]
+            conf_ptr = self._get_nested_dict(base_conf, intermediate_options)
 
             # Remove option and set updated config values for the actual option
             # while checking that the option to be removed is actually a value
@@ -680,10 +971,11 @@ class ConfigurationManager(object):
                     f"Deleting option {option} with keyring because it was "
                     f"marked as secure."
                 )
-                try:
-                    keyring.delete_password(section, option)
-                except Exception:
-                    pass
+                if self._is_secure_enabled():
+                    try:
+                        keyring.delete_password(section, option)
+                    except Exception:
+                        pass
             else:
                 config.remove_option(section, option)
 
@@ -692,10 +984,11 @@ class ConfigurationManager(object):
         config = self.get_active_conf(section)
         config.reset_to_defaults(section=section)
         if notification:
-            if section is not None:
-                self.notify_section_all_observers(section)
-            else:
-                self.notify_all_observers()
+            with self.batch_notifications():
+                if section is not None:
+                    self.notify_section_all_observers(section)
+                else:
+                    self.notify_all_observers()
 
     def reset_manager(self):
         for observer in self._observer_map_keys.copy():
@@ -714,21 +1007,23 @@ class ConfigurationManager(object):
         config = self._user_config
 
         if plugin_name in self._plugin_configs:
-            plugin_class, config = self._plugin_configs[plugin_name]
+            plugin_class, config = self._get_plugin_config(plugin_name)
 
             # Check if plugin has a separate file
             if not plugin_class.CONF_FILE:
                 config = self._user_config
 
         elif context in self._plugin_configs:
-            plugin_class, config = self._plugin_configs[context]
+            plugin_class, config = self._get_plugin_config(context)
 
             # Check if plugin has a separate file
             if not plugin_class.CONF_FILE:
                 config = self._user_config
 
-        elif context in (self._user_config.sections()
-                         + EXTRA_VALID_SHORTCUT_CONTEXTS):
+        elif (
+            context in EXTRA_VALID_SHORTCUT_CONTEXTS
+            or self._user_config.has_section(context)
+        ):
             config = self._user_config
         else:
             raise ValueError(_("Shortcut context must match '_' or the "
@@ -752,7 +1047,7 @@ class ConfigurationManager(object):
         Context must be either '_' for global or the name of a plugin.
         """
         config = self._get_shortcut_config(context, plugin_name)
-        option = f"{context}/{name}"
+        option = sys.intern(f"{context}/{name}")
         current_shortcut = config.get("shortcuts", option, default="")
 
         if current_shortcut != keystr:
@@ -762,30 +1057,45 @@ class ConfigurationManager(object):
     def iter_shortcuts(self):
         """Iterate over keyboard shortcuts."""
         for context_name, keystr in self._user_config.items('shortcuts'):
-            if context_name == 'enable':
+            context, sep, name = context_name.partition('/')
+            if not sep:
+                # Options that are not shortcuts (e.g. `enable`)
                 continue
 
             if 'additional_configuration' not in context_name:
-                context, name = context_name.split('/', 1)
                 yield context, name, keystr
 
-        for __, (__, plugin_config) in self._plugin_configs.items():
+        for conf_section in list(self._plugin_configs):
+            __, plugin_config = self._get_plugin_config(conf_section)
             items = plugin_config.items('shortcuts')
             if items:
                 for context_name, keystr in items:
-                    context, name = context_name.split('/', 1)
+                    context, __, name = context_name.partition('/')
                     yield context, name, keystr
 
     def reset_shortcuts(self):
         """Reset keyboard shortcuts to default values."""
-        self._user_config.reset_to_defaults(section='shortcuts')
-        for __, (__, plugin_config) in self._plugin_configs.items():
-            # TODO: check if the section exists?
-            plugin_config.reset_to_defaults(section='shortcuts')
+        configs = [self._user_config]
+        for conf_section, (plugin_class, __) in list(
+            self._plugin_configs.items()
+        ):
+            # There's nothing to reset if the plugin doesn't define default
+            # shortcuts, so its config doesn't need to be loaded for that.
+            defaults = plugin_class.CONF_DEFAULTS or []
+            if not any(sec == 'shortcuts' for sec, __ in defaults):
+                continue
+
+            configs.append(self._get_plugin_config(conf_section)[1])
 
-        # This necessary to notify the observers of widget shortcuts
-        self.notify_section_all_observers(section="shortcuts")
+        old_shortcuts = [config.items('shortcuts') for config in configs]
+        for config in configs:
+            config.reset_to_defaults(section='shortcuts')
+        new_shortcuts = [config.items('shortcuts') for config in configs]
 
+        # This necessary to notify the observers of widget shortcuts. It's
+        # skipped if all shortcuts already had their default values.
+        if new_shortcuts != old_shortcuts:
+            self.notify_section_all_observers(section="shortcuts")
 
 try:
     CONF = ConfigurationManager()
@@ -155,5 +155,98 @@ def test_secure_options():
     clear_site_config()
 
 
+def test_batch_notifications():
+    """
+    Test that notifications are sent once per option and section when they
+    are batched.
+    """
+    clear_site_config()
+
+    class Observer:
+        def __init__(self):
+            self.changes = []
+
+        def on_configuration_change(self, option, section, value):
+            self.changes.append((option, section, value))
+
+    config = ConfigurationManager()
+    observer = Observer()
+    config.observe_configuration(observer, 'main', 'memory_usage/timeout')
+    config.observe_configuration(observer, 'main')
+
+    with config.batch_notifications():
+        config.set('main', 'memory_usage/timeout', 1000)
+        config.set('main', 'memory_usage/timeout', 2000)
+
+        # Nothing is sent inside the batch
+        assert observer.changes == []
+
+    section_changes = [c for c in observer.changes if c[0] == '__section']
+    option_changes = [c for c in observer.changes if c[0] != '__section']
+    assert len(section_changes) == 1
+    assert option_changes == [('memory_usage/timeout', 'main', 2000)]
+
+    # Notifications are sent right away outside a batch
+    observer.changes = []
+    config.set('main', 'memory_usage/timeout', 3000)
+    assert ('memory_usage/timeout', 'main', 3000) in observer.changes
+
+    # Setting the same value again doesn't notify anything
+    observer.changes = []
+    config.set('main', 'memory_usage/timeout', 3000)
+    assert observer.changes == []
+
+    config.unobserve_configuration(observer)
+    clear_site_config()
+
+
+def test_batch_saves():
+    """Test that config files are written when batched saves finish."""
+    clear_site_config()
+
+    class Observer:
+        def __init__(self):
+            self.changes = []
+
+        def on_configuration_change(self, option, section, value):
+            self.changes.append((option, section, value))
+
+    config = ConfigurationManager()
+    user_path = config.get_user_config_path()
+    conf_fpath = osp.join(user_path, 'griffin.ini')
+
+    observer = Observer()
+    config.observe_configuration(observer, 'main', 'prompt_on_exit')
+    vertical_tabs = config.get('main', 'vertical_tabs')
+    prompt_on_exit = config.get('main', 'prompt_on_exit')
+
+    with config.batch_saves():
+        config.set('main', 'memory_usage/timeout', 4000)
+        config.set('main', 'cpu_usage/timeout', 5000)
+
+        # Values are available before they're saved
+        assert config.get('main', 'memory_usage/timeout') == 4000
+
+        with open(conf_fpath, 'r') as f:
+            contents = f.read()
+        assert 'memory_usage/timeout = 4000' not in contents
+
+        # Setting the same value in a section with unsaved changes doesn't
+        # notify anything
+        config.set('main', 'vertical_tabs', not vertical_tabs)
+        config.set('main', 'prompt_on_exit', prompt_on_exit)
+        assert observer.changes == []
+
+    with open(conf_fpath, 'r') as f:
+        contents = f.read()
+    assert 'memory_usage/timeout = 4000' in contents
+    assert 'cpu_usage/timeout = 5000' in contents
+    assert f'vertical_tabs = {not vertical_tabs}' in contents
+
+    config.unobserve_configuration(observer)
+    config.set('main', 'vertical_tabs', vertical_tabs)
+    clear_site_config()
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -157,6 +157,38 @@ def test_userconfig_load_from_ini(tmpdir, capsys):
     assert 'Warning' in captured.out
 
 
+def test_userconfig_load_typed_values(tmpdir):
+    """Test that saved values keep their type when the file is loaded."""
+    name = 'foobar'
+    path = str(tmpdir)
+    defaults = [
+        ('main', {'tuple': ('#DFE1E2', False, False), 'bool': True,
+                  'int': 100})
+    ]
+    kwargs = {
+        'name': name,
+        'path': path,
+        'defaults': defaults,
+        'load': True,
+        'version': '1.0.0',
+        'backup': False,
+        'raw_mode': True,
+    }
+
+    conf = UserConfig(**kwargs)
+    conf.set('main', 'tuple', ('#000000', True, False))
+    conf.set('main', 'bool', False)
+    conf.set('main', 'int', 200)
+
+    # Load the file twice so that its cached contents are used the second
+    # time.
+    for __ in range(2):
+        conf = UserConfig(**kwargs)
+        assert conf.get('main', 'tuple') == ('#000000', True, False)
+        assert conf.get('main', 'bool') is False
+        assert conf.get('main', 'int') == 200
+
+
 # --- Public API
 def test_userconfig_get_version(userconfig, tmpconfig):
     assert tmpconfig.get_version() == CONF_VERSION
@@ -34,6 +34,20 @@ class NoDefault:
     pass
 
 
+# Parsed contents of the .ini files loaded in this process.
+# This maps file paths to (mtime_ns, size, contents) tuples, where contents
+# is a {section: {option: raw_value}} dict. It allows to not parse again files
+# that haven't changed since they were last loaded.
+_INI_CACHE = {}
+
+# Format of config versions
+VERSION_REGEX = re.compile(r'^(\d+).(\d+).(\d+)$')
+
+# Buffer size used to write .ini files. It's large enough to write most of
+# them in a single system call.
+INI_BUFFER_SIZE = 128 * 1024
+
+
 # ============================================================================
 # Defaults class
 # ============================================================================
@@ -100,9 +114,11 @@ class DefaultsConfig(cp.ConfigParser, object):
     def _save(self):
         """Save config into the associated .ini file."""
         fpath = self.get_config_fpath()
+        _INI_CACHE.pop(fpath, None)
 
         def _write_file(fpath):
-            with io.open(fpath, 'w', encoding='utf-8') as configfile:
+            with io.open(fpath, 'w', encoding='utf-8',
+                         buffering=INI_BUFFER_SIZE) as configfile:
                 self.write(configfile)
 
         # See griffin-ide/griffin#1086 and griffin-ide/griffin#1242 for background
@@ -243,7 +259,7 @@ class UserConfig(DefaultsConfig):
     @staticmethod
     def _check_version(version):
         """Check version is compliant with format."""
-        regex_check = re.match(r'^(\d+).(\d+).(\d+)$', version)
+        regex_check = VERSION_REGEX.match(version)
         if version is not None and regex_check is None:
             raise ValueError('Version number {} is incorrect - must be in '
                              'major.minor.micro format'.format(version))
@@ -332,10 +348,63 @@ class UserConfig(DefaultsConfig):
     def _load_from_ini(self, fpath):
         """Load config from the associated .ini file found at `fpath`."""
         try:
-            self.read(fpath, encoding='utf-8')
+            stat = os.stat(fpath)
+        except OSError:
+            # Nothing to load, as done by `read` for missing files
+            return
+
+        cached = _INI_CACHE.get(fpath)
+        if (
+            cached is not None
+            and cached[:2] == (stat.st_mtime_ns, stat.st_size)
+        ):
+            self._load_raw_contents(cached[2])
+            return
+
+        # Read the whole file at once and parse it from memory
+        try:
+            with io.open(fpath, 'r', encoding='utf-8') as f:
+                text = f.read()
+        except OSError:
+            # Skip files that can't be read, as done by `read`
+            return
+
+        parser = cp.ConfigParser(interpolation=None)
+        try:
+            parser.read_string(text, source=fpath)
         except cp.MissingSectionHeaderError:
             error_text = 'Warning: File contains no section headers.'
             print(error_text)  # griffin: test-skip
+            return
+
+        if parser.defaults():
+            # Options of the DEFAULT section can't be told apart from the
+            # ones of other sections after parsing, so files with it are
+            # loaded without caching them.
+            self.read_string(text, source=fpath)
+            return
+
+        contents = {
+            section: dict(options)
+            for section, options in parser._sections.items()
+        }
+        _INI_CACHE[fpath] = (stat.st_mtime_ns, stat.st_size, contents)
+        self._load_raw_contents(contents)
+
+    def _load_raw_contents(self, contents):
+        """
+        Add the raw values in `contents`, as parsed from an .ini file.
+
+        Notes
+        -----
+        Values are stored as they are, like `read` does, because `set`
+        converts them to the type of their defaults and saves the file.
+        Option names in `contents` are already transformed by `optionxform`.
+        """
+        for section, options in contents.items():
+            if not self.has_section(section):
+                cp.ConfigParser.add_section(self, section)
+            self._sections[section].update(options)
 
     def _load_old_defaults(self, old_version):
         """Read old defaults."""
@@ -923,6 +992,13 @@ class MultiUserConfig(object):
 
         return list(sorted(sections))
 
+    def has_section(self, section):
+        """Check if `section` is in any of the configuration files."""
+        return any(
+            config.has_section(section)
+            for config in self._configs_map.values()
+        )
+
     def items(self, section):
         """Return all the items option/values for the given section."""
         config = self._get_config(section, None)
@@ -8,6 +8,7 @@
 Utilities to define configuration values
 """
 
+import functools
 import os
 import os.path as osp
 import sys
@@ -173,10 +174,12 @@ EDIT_EXTENSIONS = get_edit_extensions()
 # Detection of OS specific versions
 #==============================================================================
 
+@functools.lru_cache(maxsize=1)
 def is_ubuntu():
     """Detect if we are running in an Ubuntu-based distribution"""
     if sys.platform.startswith('linux') and osp.isfile('/etc/lsb-release'):
-        release_info = open('/etc/lsb-release').read()
+        with open('/etc/lsb-release') as f:
+            release_info = f.read()
         if 'Ubuntu' in release_info:
             return True
         else:
@@ -10,6 +10,9 @@
 Appearance Plugin.
 """
 
+# Standard library imports
+import functools
+
 # Local imports
 from griffin.api.plugins import Plugins, GriffinPluginV2
 from griffin.api.plugin_registration.decorators import (
@@ -45,7 +48,10 @@ class Appearance(GriffinPluginV2):
         return _("Manage application appearance and themes.")
 
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def get_icon(cls):
+        # The icon theme can only change after a restart, so the icon is
+        # created once.
         return cls.create_icon('eyedropper')
 
     def on_initialize(self):
@@ -31,6 +31,7 @@ from griffin.plugins.application.container import (
 from griffin.plugins.console.api import ConsoleActions
 from griffin.plugins.mainmenu.api import (
     ApplicationMenus, FileMenuSections, HelpMenuSections, ToolsMenuSections)
+from griffin.plugins.shortcuts.api import ShortcutActions
 from griffin.utils.qthelpers import add_actions
 
 
@@ -62,6 +63,10 @@ class Application(GriffinPluginV2):
         container.sig_report_issue_requested.connect(self.report_issue)
         container.set_window(self._window)
 
+        # Whether the Help menu was populated. Both the MainMenu and
+        # Shortcuts available handlers below can request it.
+        self._help_menu_populated = False
+
     # --------------------- PLUGIN INITIALIZATION -----------------------------
     @on_plugin_available(plugin=Plugins.Shortcuts)
     def on_shortcuts_available(self):
@@ -197,6 +202,10 @@ class Application(GriffinPluginV2):
 
     def _populate_help_menu(self):
         """Add base actions and menus to the Help menu."""
+        if self._help_menu_populated:
+            return
+
+        self._help_menu_populated = True
         self._populate_help_menu_documentation_section()
         self._populate_help_menu_support_section()
         self._populate_help_menu_about_section()
@@ -208,7 +217,6 @@ class Application(GriffinPluginV2):
         shortcuts_summary_action = None
 
         if shortcuts:
-            from griffin.plugins.shortcuts.plugin import ShortcutActions
             shortcuts_summary_action = ShortcutActions.ShortcutSummaryAction
         for documentation_action in [
                 self.documentation_action, self.video_action]:
@@ -249,6 +257,7 @@ class Application(GriffinPluginV2):
         return self.main.window()
 
     def _depopulate_help_menu(self):
+        self._help_menu_populated = False
         self._depopulate_help_menu_documentation_section()
         self._depopulate_help_menu_support_section()
         self._depopulate_help_menu_about_section()
@@ -321,7 +330,6 @@ class Application(GriffinPluginV2):
             actions += [tutorial_action]
         # Shortcuts actions
         if shortcuts:
-            from griffin.plugins.shortcuts.plugin import ShortcutActions
             shortcuts_action = shortcuts.get_action(
                 ShortcutActions.ShortcutSummaryAction)
             actions.append(shortcuts_action)
@@ -382,18 +390,16 @@ class Application(GriffinPluginV2):
             # Hide flashing command prompt
             startupinfo = subprocess.STARTUPINFO()
             startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            shell = False
         else:
             startupinfo = None
-            shell = True
 
-        command = '"{0}" "{1}"'
-        command = command.format(python, restart_script)
+        # Pass the arguments as a list so that no shell is needed to run
+        # the script and Popen takes care of quoting them.
+        command = [python, restart_script]
 
         try:
             if self.main.closing(True, close_immediately=close_immediately):
-                subprocess.Popen(command, shell=shell, env=env,
-                                 startupinfo=startupinfo)
+                subprocess.Popen(command, env=env, startupinfo=startupinfo)
                 console.quit()
         except Exception as error:
             # If there is an error with subprocess, Griffin should not quit and
@@ -3,6 +3,8 @@
 """Module serving the "About Griffin" function"""
 
 # Standard library imports
+import functools
+import re
 import sys
 
 # Third party imports
@@ -23,6 +25,7 @@ from griffin import (
 from griffin.api.widgets.dialogs import GriffinDialogButtonBox
 from griffin.api.widgets.mixins import SvgToScaledPixmap
 from griffin.config.base import _
+from griffin.config.gui import get_fonts_version
 from griffin.utils.icon_manager import ima
 from griffin.utils.stylesheet import (
     AppStyle,
@@ -33,10 +36,79 @@ from griffin.utils.stylesheet import (
 )
 
 
+# ---- Constants
+# ----------------------------------------------------------------------------
+# Contents of the dialog labels. Their font is set for all labels in the
+# dialog stylesheet (see _build_main_css).
+_OVERVIEW_TEMPLATE = """
+<style>
+    p, h1 {{margin-bottom: 2em}}
+    h1 {{margin-top: 0}}
+</style>
+<br>
+<h1>Griffin</h1>
+
+<p>
+Quant Marketing Tools You Can Rely On
+<br>
+<a href="{website_url}">https://griffin-analytics.com</a>
+</p>"""
+
+_COMMUNITY_TEMPLATE = """
+<br>
+We empower marketers with advanced analytics and intelligent
+insights to optimize their strategies across channels."""
+
+_LEGAL_TEMPLATE = """
+<br>
+Copyright &copy; 2025 Griffin Developers"""
+
+_INFO_TEMPLATE = """
+{griffin_version}
+<br>{revlink}
+<br>({installer})
+<br>
+"""
+
+# Runs of whitespace are not significant in rich text, so they're collapsed
+# to give Qt smaller documents to parse.
+_collapse_whitespace = functools.partial(re.compile(r'\s+').sub, ' ')
+_OVERVIEW_TEMPLATE = _collapse_whitespace(_OVERVIEW_TEMPLATE)
+_COMMUNITY_TEMPLATE = _collapse_whitespace(_COMMUNITY_TEMPLATE)
+_LEGAL_TEMPLATE = _collapse_whitespace(_LEGAL_TEMPLATE)
+_INFO_TEMPLATE = _collapse_whitespace(_INFO_TEMPLATE)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_versions():
+    """
+    Return the versions shown in the dialog.
+
+    They can't change while Griffin is running, so they're computed once.
+    The Git revision is not requested because it's not displayed.
+    """
+    return get_versions(reporev=False)
+
+
+# ---- Dialog
+# ----------------------------------------------------------------------------
 class AboutDialog(QDialog, SvgToScaledPixmap):
 
     PADDING = 5 if MAC else 15
 
+    # Margins around the tab labels and the tab pane
+    LABEL_MARGIN = (3 if MAC else 1) * PADDING
+    PANE_MARGIN_TOP = (3 if MAC else 2) * AppStyle.MarginSize
+    PANE_MARGIN_BOTTOM = (0 if MAC else 2) * AppStyle.MarginSize
+
+    # Stylesheets shared by all instances of the dialog. They depend on the
+    # interface font, so they're generated again when fonts change.
+    _stylesheet_cache = {}
+    _stylesheet_cache_fonts_version = None
+
+    # Rendered Griffin logo, per custom scale factor settings
+    _pixmap_cache = {}
+
     def __init__(self, parent):
         """Create About Griffin dialog with general information."""
         QDialog.__init__(self, parent)
@@ -46,7 +118,7 @@ class AboutDialog(QDialog, SvgToScaledPixmap):
         )
         self.setWindowTitle(_("About Griffin"))
         self.setWindowIcon(ima.icon("MessageBoxInformation"))
-        versions = get_versions()
+        versions = _get_versions()
 
         # -- Show Git revision for development version
         revlink = ''
@@ -55,92 +127,32 @@ class AboutDialog(QDialog, SvgToScaledPixmap):
         #    revlink = ("<a href='https://github.com/griffin-ide/griffin/"
         #               "commit/%s'>%s</a>" % (rev, rev))
 
-        # -- Style attributes
-        font_family = self.font().family()
-        font_size = DialogStyle.ContentFontSize
-
         # -- Labels
         #twitter_url = "https://twitter.com/Griffin_IDE",
         #facebook_url = "https://www.facebook.com/GriffinIDE",
         #youtube_url = "https://www.youtube.com/Griffin-IDE",
         #instagram_url = "https://www.instagram.com/griffinide/",
         self.label_overview = QLabel(
-            f"""
-            <style>
-                p, h1 {{margin-bottom: 2em}}
-                h1 {{margin-top: 0}}
-            </style>
-
-            <div style='font-family: "{font_family}";
-                        font-size: {font_size};
-                        font-weight: normal;
-                        '>
-            <br>
-            <h1>Griffin</h1>
-
-            <p>
-            Quant Marketing Tools You Can Rely On
-            <br>
-            <a href="{website_url}">https://griffin-analytics.com</a>
-            </p>
-
-
-
-            </div>"""
+            _OVERVIEW_TEMPLATE.format(website_url=website_url)
         )
 
-        self.label_community = QLabel(
-            f"""
-            <div style='font-family: "{font_family}";
-                        font-size: {font_size};
-                        font-weight: normal;
-                        '>
-            <br>
-            We empower marketers with advanced analytics and intelligent 
-            insights to optimize their strategies across channels. 
-            </div>""")
-
-        self.label_legal = QLabel(
-            f"""
-            <div style='font-family: "{font_family}";
-                        font-size: {font_size};
-                        font-weight: normal;
-                        '>
-            <br>
-            Copyright &copy; 2025 Griffin Developers            
-            </div>
-            """)
-
-        for label in [self.label_overview, self.label_community,
-                      self.label_legal]:
-            label.setWordWrap(True)
-            label.setAlignment(Qt.AlignTop)
-            label.setOpenExternalLinks(True)
-            label.setTextInteractionFlags(Qt.TextBrowserInteraction)
-            label.setContentsMargins(
-                (3 if MAC else 1) * self.PADDING,
-                0,
-                (3 if MAC else 1) * self.PADDING,
-                (3 if MAC else 1) * self.PADDING,
-            )
+        self._setup_label(self.label_overview)
+
+        # The labels of the Community and Legal tabs are created the first
+        # time those tabs are shown (see _ensure_tab_built).
+        self.label_community = None
+        self.label_legal = None
 
         self.label_pic = QLabel(self)
-        self.label_pic.setPixmap(
-            self.svg_to_scaled_pixmap("griffin_about", rescale=0.45)
-        )
+        self.label_pic.setPixmap(self._get_about_pixmap())
         self.label_pic.setAlignment(Qt.AlignBottom)
 
         self.info = QLabel(
-            f"""
-            <div style='font-family: "{font_family}";
-                font-size: {font_size};
-                font-weight: normal;
-                '>
-            {versions['griffin']}
-            <br>{revlink}
-            <br>({versions['installer']})
-            <br>
-            """
+            _INFO_TEMPLATE.format(
+                griffin_version=versions['griffin'],
+                revlink=revlink,
+                installer=versions['installer'],
+            )
         )
         self.info.setAlignment(Qt.AlignHCenter)
 
@@ -151,16 +163,15 @@ class AboutDialog(QDialog, SvgToScaledPixmap):
 
         scroll_community = QScrollArea(self)
         scroll_community.setWidgetResizable(True)
-        scroll_community.setWidget(self.label_community)
 
         scroll_legal = QScrollArea(self)
         scroll_legal.setWidgetResizable(True)
-        scroll_legal.setWidget(self.label_legal)
 
         # Style for scroll areas needs to be applied after creating them.
         # Otherwise it doesn't have effect.
+        scrollarea_stylesheet = self._scrollarea_stylesheet
         for scroll_area in [scroll_overview, scroll_community, scroll_legal]:
-            scroll_area.setStyleSheet(self._scrollarea_stylesheet)
+            scroll_area.setStyleSheet(scrollarea_stylesheet)
 
         # -- Tabs
         self.tabs = QTabWidget(self)
@@ -170,6 +181,11 @@ class AboutDialog(QDialog, SvgToScaledPixmap):
         self.tabs.setElideMode(Qt.ElideNone)
         self.tabs.setStyleSheet(self._tabs_stylesheet)
 
+        self._tab_builders = {
+            self.tabs.indexOf(scroll_community): self._build_community_label,
+            self.tabs.indexOf(scroll_legal): self._build_legal_label,
+        }
+
         # -- Buttons
         bbox = GriffinDialogButtonBox(QDialogButtonBox.Ok)
         info_btn = QPushButton(_("Copy version info"))
@@ -224,6 +240,7 @@ class AboutDialog(QDialog, SvgToScaledPixmap):
         # -- Signals
         info_btn.clicked.connect(self.copy_to_clipboard)
         bbox.accepted.connect(self.accept)
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
 
         # -- Style
         size = (600, 460) if MAC else ((585, 450) if WIN else (610, 455))
@@ -233,8 +250,74 @@ class AboutDialog(QDialog, SvgToScaledPixmap):
     def copy_to_clipboard(self):
         QApplication.clipboard().setText(get_versions_text())
 
+    def _get_about_pixmap(self):
+        """Return the Griffin logo, rendering it only when needed."""
+        # The pixmap size depends on these options (see svg_to_scaled_pixmap)
+        key = (
+            self.get_conf('high_dpi_custom_scale_factor', section='main'),
+            self.get_conf('high_dpi_custom_scale_factors', section='main'),
+        )
+
+        pixmap = self._pixmap_cache.get(key)
+        if pixmap is None:
+            pixmap = self.svg_to_scaled_pixmap("griffin_about", rescale=0.45)
+            self._pixmap_cache[key] = pixmap
+
+        return pixmap
+
+    def _setup_label(self, label):
+        """Set the options shared by the labels shown in tabs."""
+        label.setWordWrap(True)
+        label.setAlignment(Qt.AlignTop)
+        label.setOpenExternalLinks(True)
+        label.setTextInteractionFlags(Qt.TextBrowserInteraction)
+        label.setContentsMargins(
+            self.LABEL_MARGIN, 0, self.LABEL_MARGIN, self.LABEL_MARGIN
+        )
+
+    def _build_community_label(self):
+        self.label_community = QLabel(_COMMUNITY_TEMPLATE)
+        return self.label_community
+
+    def _build_legal_label(self):
+        self.label_legal = QLabel(_LEGAL_TEMPLATE)
+        return self.label_legal
+
+    def _ensure_tab_built(self, index):
+        """Create the contents of the tab at `index` if it wasn't shown yet."""
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+
+        label = builder()
+        self._setup_label(label)
+
+        scroll_area = self.tabs.widget(index)
+        scroll_area.setWidget(label)
+
+        # Widgets added to visible scroll areas need to be shown explicitly
+        label.show()
+
+    def _cached_css(self, name, builder):
+        """Return the stylesheet `name`, calling `builder` if needed."""
+        cls = type(self)
+        fonts_version = get_fonts_version()
+        if cls._stylesheet_cache_fonts_version != fonts_version:
+            cls._stylesheet_cache = {}
+            cls._stylesheet_cache_fonts_version = fonts_version
+
+        key = (name, self.PADDING)
+        css = cls._stylesheet_cache.get(key)
+        if css is None:
+            css = cls._stylesheet_cache[key] = builder()
+
+        return css
+
     @property
     def _main_stylesheet(self):
+        return self._cached_css('main', self._build_main_css)
+
+    def _build_main_css(self):
         tabs_stylesheet = PREFERENCES_TABBAR_STYLESHEET.get_copy()
         css = tabs_stylesheet.get_stylesheet()
 
@@ -244,10 +327,20 @@ class AboutDialog(QDialog, SvgToScaledPixmap):
                 backgroundColor=DialogStyle.BackgroundColor
             )
 
+        # Set the font of all labels here instead of in their contents
+        css.QLabel.setValues(
+            fontFamily=f'"{self.font().family()}"',
+            fontSize=DialogStyle.ContentFontSize,
+            fontWeight="normal",
+        )
+
         return css.toString()
 
     @property
     def _scrollarea_stylesheet(self):
+        return self._cached_css('scrollarea', self._build_scrollarea_css)
+
+    def _build_scrollarea_css(self):
         css = qstylizer.style.StyleSheet()
 
         # This is the only way to make the scroll areas to have the same
@@ -274,6 +367,9 @@ class AboutDialog(QDialog, SvgToScaledPixmap):
 
     @property
     def _button_stylesheet(self):
+        return self._cached_css('button', self._build_button_css)
+
+    def _build_button_css(self):
         css = qstylizer.style.StyleSheet()
 
         # Increase font size and padding
@@ -286,6 +382,9 @@ class AboutDialog(QDialog, SvgToScaledPixmap):
 
     @property
     def _tabs_stylesheet(self):
+        return self._cached_css('tabs', self._build_tabs_css)
+
+    def _build_tabs_css(self):
         css = qstylizer.style.StyleSheet()
 
         # This fixes a visual glitch with the tabbar background color
@@ -295,9 +394,9 @@ class AboutDialog(QDialog, SvgToScaledPixmap):
 
         css['QTabWidget::pane'].setValues(
             # Set tab pane margins according to the dialog contents and layout
-            marginTop=f"{(3 if MAC else 2) * AppStyle.MarginSize}px",
+            marginTop=f"{self.PANE_MARGIN_TOP}px",
             marginRight=f"{self.PADDING}px",
-            marginBottom=f"{(0 if MAC else 2) * AppStyle.MarginSize}px",
+            marginBottom=f"{self.PANE_MARGIN_BOTTOM}px",
             marginLeft="0px",
             # Padding is not necessary in this case because we set a border for
             # the scroll areas.
@@ -29,14 +29,13 @@ class FallbackProvider(GriffinCompletionProvider):
     def __init__(self, parent, config):
         GriffinCompletionProvider.__init__(self, parent, config)
         self.fallback_actor = FallbackActor(self)
-        self.fallback_actor.sig_fallback_ready.connect(
-            lambda: self.sig_provider_ready.emit(
-                self.COMPLETION_PROVIDER_NAME))
         self.fallback_actor.sig_set_tokens.connect(
-            lambda _id, resp: self.sig_response_ready.emit(
-                self.COMPLETION_PROVIDER_NAME, _id, resp))
+            self.signal_response_ready)
         self.started = False
-        self.requests = {}
+
+        # The actor thread is started when the first request is sent, so
+        # that it's not created in sessions where it's never used.
+        self._actor_started = False
 
     def get_name(self):
         return _('Fallback')
@@ -46,15 +45,34 @@ class FallbackProvider(GriffinCompletionProvider):
 
     def start(self):
         if not self.started:
-            self.fallback_actor.start()
             self.started = True
 
+            # Requests can be accepted right away because the actor is
+            # started on demand (see send_request).
+            self.signal_provider_ready()
+
+    def signal_provider_ready(self):
+        self.sig_provider_ready.emit(self.COMPLETION_PROVIDER_NAME)
+
+    def signal_response_ready(self, _id, resp):
+        self.sig_response_ready.emit(self.COMPLETION_PROVIDER_NAME, _id, resp)
+
     def shutdown(self):
         if self.started:
-            self.fallback_actor.stop()
+            if self._actor_started:
+                self.fallback_actor.stop()
+                self._actor_started = False
             self.started = False
 
     def send_request(self, language, req_type, req, req_id=None):
+        # The actor thread is not running, so it can't answer
+        if not self.started:
+            return
+
+        if not self._actor_started:
+            self.fallback_actor.start()
+            self._actor_started = True
+
         request = {
             'type': req_type,
             'file': req['file'],
@@ -23,6 +23,7 @@ from griffin.api.translations import _
 from griffin.config.base import get_conf_path
 from griffin.plugins.help.confpage import HelpConfigPage
 from griffin.plugins.help.widgets import HelpWidget
+from griffin.plugins.shortcuts.api import ShortcutActions
 
 
 class HelpActions:
@@ -201,7 +202,6 @@ class Help(GriffinDockablePlugin):
         shortcuts = self.get_plugin(Plugins.Shortcuts)
         shortcuts_summary_action = None
         if shortcuts:
-            from griffin.plugins.shortcuts.plugin import ShortcutActions
             shortcuts_summary_action = ShortcutActions.ShortcutSummaryAction
         if mainmenu:
             from griffin.plugins.mainmenu.api import (
@@ -5,3 +5,7 @@
 # (see griffin/__init__.py for details)
 
 """Shortcut API."""
+
+
+class ShortcutActions:
+    ShortcutSummaryAction = "show_shortcut_summary_action"
@@ -27,6 +27,7 @@ from griffin.api.plugin_registration.decorators import (
 from griffin.api.shortcuts import GriffinShortcutsMixin
 from griffin.api.translations import _
 from griffin.plugins.mainmenu.api import ApplicationMenus, HelpMenuSections
+from griffin.plugins.shortcuts.api import ShortcutActions
 from griffin.plugins.shortcuts.confpage import ShortcutsConfigPage
 from griffin.plugins.shortcuts.utils import (
     ShortcutData,
@@ -36,10 +37,6 @@ from griffin.plugins.shortcuts.widgets.summary import ShortcutsSummaryDialog
 from griffin.utils.qthelpers import add_shortcut_to_tooltip, GriffinAction
 
 
-class ShortcutActions:
-    ShortcutSummaryAction = "show_shortcut_summary_action"
-
-
 # --- Plugin
 # ----------------------------------------------------------------------------
 class Shortcuts(GriffinPluginV2, GriffinShortcutsMixin):
@@ -149,7 +149,9 @@ class GriffinConfigPage(SidebarPage, ConfigAccessMixin):
             if self.pre_apply_callback is not None:
                 self.pre_apply_callback()
 
-            self.save_to_conf()
+            # Write each config file once for all the changed options
+            with CONF.batch_saves():
+                self.save_to_conf()
 
             if self.apply_callback is not None:
                 self.apply_callback()